@@ -14,6 +14,11 @@ from openpyxl.utils import get_column_letter
 VERSION = "1.2.0"
 LAST_UPDATED = "2025-10-09"
 
+def set_column_widths(ws, widths):
+    """Set widths for consecutive columns starting at column A"""
+    for i, width in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(i)].width = width
+
 def extract_customer_from_description(description, summary):
     """Extract customer name from description using various patterns"""
     if pd.isna(description) and pd.isna(summary):
@@ -504,8 +509,7 @@ def create_dashboard(csv_path, output_file, csv_name=None):
     
     # Set column widths
     column_widths = [15, 12, 25, 10, 15, 20, 15]
-    for i, width in enumerate(column_widths, 1):
-        ws.column_dimensions[get_column_letter(i)].width = width
+    set_column_widths(ws, column_widths)
     
     # Create detailed cases sheet with enhanced columns
     ws2 = wb.create_sheet("Detailed Cases from CSV")
@@ -630,8 +634,7 @@ def create_dashboard(csv_path, output_file, csv_name=None):
     
     # Set column widths for detailed cases
     detailed_column_widths = [12, 25, 10, 15, 20, 30, 40, 50, 25, 25, 10, 12]
-    for i, width in enumerate(detailed_column_widths, 1):
-        ws2.column_dimensions[get_column_letter(i)].width = width
+    set_column_widths(ws2, detailed_column_widths)
     
     # Create Comprehensive Error Types sheet
     ws3 = wb.create_sheet("Comprehensive Error Types")
@@ -673,8 +676,7 @@ def create_dashboard(csv_path, output_file, csv_name=None):
     
     # Set column widths
     error_column_widths = [25, 10, 15]
-    for i, width in enumerate(error_column_widths, 1):
-        ws3.column_dimensions[get_column_letter(i)].width = width
+    set_column_widths(ws3, error_column_widths)
     
     # Create Customer Analysis sheet
     ws4 = wb.create_sheet("Customer Analysis")
@@ -717,8 +719,7 @@ def create_dashboard(csv_path, output_file, csv_name=None):
     
     # Set column widths
     customer_column_widths = [30, 10, 25, 15]
-    for i, width in enumerate(customer_column_widths, 1):
-        ws4.column_dimensions[get_column_letter(i)].width = width
+    set_column_widths(ws4, customer_column_widths)
     
     # Save workbook
     wb.save(output_file)
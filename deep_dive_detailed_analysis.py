@@ -9,181 +9,235 @@ Usage:
 """
 
 import pandas as pd
+import numpy as np
 import argparse
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import wraps
+from itertools import islice
 import openpyxl
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+from openpyxl.formatting.rule import CellIsRule, FormulaRule
 from openpyxl.utils import get_column_letter
-from collections import defaultdict, Counter
+from collections import Counter
 
 VERSION = "1.0.0"
 
+# Exports with at least this many cases run the extractors in worker processes;
+# below it, pool start-up costs more than the regex work it spreads out
+PARALLEL_MIN_CASES = 5000
+
+# Rows read from the CSV at a time; only one chunk of the free-text columns is
+# held in memory while its details are extracted
+CSV_CHUNK_SIZE = 20000
+
 # ============================================================================
 # EXTRACTION FUNCTIONS
 # ============================================================================
 
-def extract_flow_names(text):
+def _isna(value):
+    """Scalar missing-value check (None, NaN or pd.NA) without pd.isna dispatch."""
+    return value is None or value is pd.NA or (isinstance(value, float) and value != value)
+
+def _text_extractor(extract):
+    """Give a text extractor NaN handling, passing everything else on as a string."""
+    @wraps(extract)
+    def extractor(text):
+        if _isna(text):
+            return []
+        return extract(str(text))
+    
+    return extractor
+
+# Explicit flow names in brackets or quotes
+_FLOW_EXPLICIT_PATTERNS = [
+    re.compile(r'flow\s*name[:\s]+([^\n\]]+?)[\]\n]', re.IGNORECASE),  # Flow Name: ...
+    re.compile(r'\[([^\]]{10,80})\]', re.IGNORECASE),  # Text in brackets (often flow names)
+    re.compile(r'"([^"]{10,80}(?:flow|import|export|sync)[^"]{0,20})"', re.IGNORECASE),  # Quoted flow names
+]
+
+# Common flow patterns with context
+_FLOW_CONTEXT_PATTERNS = [
+    re.compile(r'(?:in|from|at)\s+(?:the\s+)?([a-zA-Z0-9\s\-]{1,60}\s+(?:to|from)\s+[a-zA-Z0-9\s\-]{1,60})\s+flow', re.IGNORECASE),
+    re.compile(r'([a-zA-Z]+\s+(?:to|from)\s+[a-zA-Z]+\s+(?:flow|import|export|sync))', re.IGNORECASE),
+    re.compile(r'(?:the|a)\s+([a-zA-Z0-9\s]{1,60}(?:import|export|sync|flow))\s+(?:is|has|was|flow)', re.IGNORECASE),
+]
+
+_FLOW_PATTERNS = _FLOW_EXPLICIT_PATTERNS + _FLOW_CONTEXT_PATTERNS
+
+# Words at least one of which every non-bracket flow pattern requires
+_FLOW_TRIGGERS = ('flow', 'import', 'export', 'sync')
+
+# Specific flow type keywords (high confidence), grouped by record family
+_FLOW_KEYWORDS = (
+    'order to netsuite', 'netsuite to order', 'order import', 'order export',
+    'sales order', 'purchase order', 'order sync',
+    'product import', 'product export', 'product sync', 'item sync',
+    'inventory sync', 'inventory import', 'inventory export',
+    'customer sync', 'customer import', 'customer export',
+    'item fulfillment', 'fulfillment sync', 'fulfillment import',
+    'settlement', 'settlement import', 'settlement report',
+    'shipment', 'shipment import', 'shipment export',
+    'refund', 'refund import', 'refund sync',
+    'payment sync', 'payment import', 'customer payment',
+    'invoice sync', 'invoice import', 'invoice export',
+    'cash sale', 'cash sale import',
+    'credit memo', 'credit memo import',
+)
+
+# Generic phrases that disqualify a flow candidate
+_FLOW_GENERIC_PATTERN = re.compile('|'.join(map(re.escape, [
+    'the flow', 'a flow', 'this flow', 'run the', 'failed to',
+    'unable to', 'trying to', 'want to', 'need to',
+])))
+
+# Punctuation trimmed from both ends of extracted candidates once surrounding
+# whitespace is gone (plain strip() first, so NBSPs from Jira exports go too)
+_FLOW_STRIP_CHARS = ':,[]'
+_FIELD_STRIP_CHARS = ':,'
+_ERROR_STRIP_CHARS = ':,"'
+
+@_text_extractor
+def extract_flow_names(text_str):
     """Extract flow names from text - improved to get cleaner, more specific flow names."""
-    if pd.isna(text):
-        return []
-    
-    text_str = str(text)
     flows = []
+    text_lower = text_str.lower()
     
-    # Look for explicit flow names in brackets or quotes
-    explicit_patterns = [
-        r'flow\s*name[:\s]+([^\n\]]+?)[\]\n]',  # Flow Name: ...
-        r'\[([^\]]{10,80})\]',  # Text in brackets (often flow names)
-        r'"([^"]{10,80}(?:flow|import|export|sync)[^"]{0,20})"',  # Quoted flow names
-    ]
-    
-    for pattern in explicit_patterns:
-        matches = re.findall(pattern, text_str, re.IGNORECASE)
-        flows.extend(matches)
-    
-    # Common flow patterns with context
-    flow_patterns = [
-        r'(?:in|from|at)\s+(?:the\s+)?([a-zA-Z0-9\s\-]+\s+(?:to|from)\s+[a-zA-Z0-9\s\-]+)\s+flow',
-        r'([a-zA-Z]+\s+(?:to|from)\s+[a-zA-Z]+\s+(?:flow|import|export|sync))',
-        r'(?:the|a)\s+([a-zA-Z0-9\s]+(?:import|export|sync|flow))\s+(?:is|has|was|flow)',
-    ]
-    
-    for pattern in flow_patterns:
-        matches = re.findall(pattern, text_str, re.IGNORECASE)
-        flows.extend(matches)
+    # The flow patterns all need a bracket or one of the trigger words
+    if '[' in text_str or any(word in text_lower for word in _FLOW_TRIGGERS):
+        # Explicit flow names in brackets or quotes, then common flow patterns
+        # with context; captures too short to survive cleanup are never sliced out
+        for pattern in _FLOW_PATTERNS:
+            for match in pattern.finditer(text_str):
+                start, end = match.span(1)
+                if end - start >= 5:
+                    flows.append(match.group(1))
     
     # Specific flow type keywords (high confidence)
-    flow_keywords = {
-        'order': ['order to netsuite', 'netsuite to order', 'order import', 'order export', 
-                  'sales order', 'purchase order', 'order sync'],
-        'product': ['product import', 'product export', 'product sync', 'item sync'],
-        'inventory': ['inventory sync', 'inventory import', 'inventory export'],
-        'customer': ['customer sync', 'customer import', 'customer export'],
-        'fulfillment': ['item fulfillment', 'fulfillment sync', 'fulfillment import'],
-        'settlement': ['settlement', 'settlement import', 'settlement report'],
-        'shipment': ['shipment', 'shipment import', 'shipment export'],
-        'refund': ['refund', 'refund import', 'refund sync'],
-        'payment': ['payment sync', 'payment import', 'customer payment'],
-        'invoice': ['invoice sync', 'invoice import', 'invoice export'],
-        'cash sale': ['cash sale', 'cash sale import'],
-        'credit memo': ['credit memo', 'credit memo import'],
-    }
-    
-    text_lower = text_str.lower()
-    for category, keywords in flow_keywords.items():
-        for keyword in keywords:
-            if keyword in text_lower:
-                flows.append(keyword)
+    flows.extend(keyword for keyword in _FLOW_KEYWORDS if keyword in text_lower)
     
     # Clean and deduplicate
     cleaned_flows = []
     seen_flows = set()
     
     for flow in flows:
-        flow = flow.strip().strip(':').strip(',').strip(']').strip('[')
-        flow = re.sub(r'\s+', ' ', flow)  # Normalize whitespace
+        flow = ' '.join(flow.strip().strip(_FLOW_STRIP_CHARS).split())  # Trim and normalize whitespace
         
         # Skip if too short or too generic
         if len(flow) < 5:
             continue
         
         # Skip generic words
-        generic = ['the flow', 'a flow', 'this flow', 'run the', 'failed to', 
-                   'unable to', 'trying to', 'want to', 'need to']
-        if any(g in flow.lower() for g in generic):
+        flow_lower = flow.lower()
+        if _FLOW_GENERIC_PATTERN.search(flow_lower):
             continue
         
         # Check for duplicates (case-insensitive)
-        flow_lower = flow.lower()
         if flow_lower not in seen_flows:
             cleaned_flows.append(flow)
             seen_flows.add(flow_lower)
     
     return cleaned_flows[:8]  # Limit to 8 most relevant
 
-def extract_field_mappings(text):
+# Field mapping patterns
+_FIELD_PATTERNS = [
+    re.compile(r'field[:\s]+([a-zA-Z0-9_\s]+?)(?=\s+(?:is|not|missing|error|fail|$))', re.IGNORECASE),
+    re.compile(r'mapping[:\s]+([^,.\n]+?)(?=\s+(?:is|not|missing|error|fail|$))', re.IGNORECASE),
+    re.compile(r'(?:missing|undefined|null)\s+(?:field|value|mapping)[:\s]+([a-zA-Z0-9_\s]+)', re.IGNORECASE),
+    re.compile(r'([a-zA-Z0-9_]+)\s+field\s+(?:is|not|missing|error)', re.IGNORECASE),
+    re.compile(r'custom\s+field[:\s]+([a-zA-Z0-9_\s]+)', re.IGNORECASE),
+    re.compile(r'(?:netsuite|shopify|salesforce|amazon)\s+field[:\s]+([a-zA-Z0-9_\s]+)', re.IGNORECASE),
+]
+
+# Words at least one of which every field pattern requires
+_FIELD_TRIGGERS = ('field', 'mapping', 'value')
+
+def _iter_field_mappings(text_str):
+    """Yield cleaned, de-duplicated field/mapping issues in pattern order."""
+    seen_mappings = set()
+    
+    for pattern in _FIELD_PATTERNS:
+        for match in pattern.finditer(text_str):
+            mapping = match.group(1).strip().strip(_FIELD_STRIP_CHARS)
+            if len(mapping) > 2 and mapping not in seen_mappings:
+                seen_mappings.add(mapping)
+                yield mapping
+
+@_text_extractor
+def extract_field_mappings(text_str):
     """Extract field and mapping issues from text."""
-    if pd.isna(text):
+    text_lower = text_str.lower()
+    if not any(word in text_lower for word in _FIELD_TRIGGERS):
         return []
     
-    text_str = str(text)
-    mappings = []
-    
-    # Field mapping patterns
-    field_patterns = [
-        r'field[:\s]+([a-zA-Z0-9_\s]+?)(?=\s+(?:is|not|missing|error|fail|$))',
-        r'mapping[:\s]+([^,.\n]+?)(?=\s+(?:is|not|missing|error|fail|$))',
-        r'(?:missing|undefined|null)\s+(?:field|value|mapping)[:\s]+([a-zA-Z0-9_\s]+)',
-        r'([a-zA-Z0-9_]+)\s+field\s+(?:is|not|missing|error)',
-        r'custom\s+field[:\s]+([a-zA-Z0-9_\s]+)',
-        r'(?:netsuite|shopify|salesforce|amazon)\s+field[:\s]+([a-zA-Z0-9_\s]+)',
-    ]
-    
-    for pattern in field_patterns:
-        matches = re.findall(pattern, text_str, re.IGNORECASE)
-        mappings.extend(matches)
-    
-    # Clean and deduplicate
-    cleaned_mappings = []
-    for mapping in mappings:
-        mapping = mapping.strip().strip(':').strip(',')
-        if len(mapping) > 2 and mapping not in cleaned_mappings:
-            cleaned_mappings.append(mapping)
-    
-    return cleaned_mappings[:15]  # Limit to 15 most relevant
+    # Stops scanning once the 15 most relevant are found
+    return list(islice(_iter_field_mappings(text_str), 15))
+
+# Complete error message patterns (case-sensitive: most anchor on a capital letter)
+_ERROR_PATTERNS = [
+    # Error with full message in quotes
+    re.compile(r'[Ee]rror[:\s]+"([^"]{20,200})"'),
+    # Error: message pattern (capture until period or newline)
+    re.compile(r'[Ee]rror[:\s]+([A-Z][^.\n]{20,200}[.!])'),
+    # Exception patterns
+    re.compile(r'[Ee]xception[:\s]+([A-Z][^.\n]{20,200}[.!])'),
+    # Status code errors
+    re.compile(r'([Ss]tatus [Cc]ode[:\s]+\d{3}[^.\n]{0,100})'),
+    # Failed to... patterns
+    re.compile(r'([Ff]ailed to [^.\n]{10,150}[.!])'),
+    # Unable to... patterns
+    re.compile(r'([Uu]unable to [^.\n]{10,150}[.!])'),
+    # Cannot... patterns
+    re.compile(r'([Cc]annot [^.\n]{10,150}[.!])'),
+    # Specific error formats
+    re.compile(r'((?:Invalid|Missing|Undefined)[^.\n]{10,150}[.!])'),
+    # Hook/function errors
+    re.compile(r'(hook (?:function )?error[^.\n]{10,150})'),
+    # Integration-specific errors
+    re.compile(r'(Integration (?:is )?corrupted[^.\n]{0,100})'),
+]
+
+# Case-sensitive literals at least one of which every error pattern contains
+_ERROR_TRIGGERS = ('rror', 'xception', 'tatus', 'ailed to', 'nable to', 'annot',
+                   'Invalid', 'Missing', 'Undefined', 'corrupted')
 
-def extract_error_messages(text):
+# Generic phrases that disqualify an error candidate
+_ERROR_GENERIC_PATTERN = re.compile('|'.join(map(re.escape, [
+    'still persists', 'not working', 'issue', 'problem',
+    'please', 'thank you', 'steps to reproduce',
+])))
+
+@_text_extractor
+def extract_error_messages(text_str):
     """Extract specific error messages from text - improved to get clean, complete errors."""
-    if pd.isna(text):
+    if not any(trigger in text_str for trigger in _ERROR_TRIGGERS):
         return []
     
-    text_str = str(text)
     errors = []
     
     # Look for complete error messages with better patterns
-    error_patterns = [
-        # Error with full message in quotes
-        r'[Ee]rror[:\s]+"([^"]{20,200})"',
-        # Error: message pattern (capture until period or newline)
-        r'[Ee]rror[:\s]+([A-Z][^.\n]{20,200}[.!])',
-        # Exception patterns
-        r'[Ee]xception[:\s]+([A-Z][^.\n]{20,200}[.!])',
-        # Status code errors
-        r'([Ss]tatus [Cc]ode[:\s]+\d{3}[^.\n]{0,100})',
-        # Failed to... patterns
-        r'([Ff]ailed to [^.\n]{10,150}[.!])',
-        # Unable to... patterns
-        r'([Uu]unable to [^.\n]{10,150}[.!])',
-        # Cannot... patterns
-        r'([Cc]annot [^.\n]{10,150}[.!])',
-        # Specific error formats
-        r'((?:Invalid|Missing|Undefined)[^.\n]{10,150}[.!])',
-        # Hook/function errors
-        r'(hook (?:function )?error[^.\n]{10,150})',
-        # Integration-specific errors
-        r'(Integration (?:is )?corrupted[^.\n]{0,100})',
-    ]
-    
-    for pattern in error_patterns:
-        matches = re.findall(pattern, text_str)
-        errors.extend(matches)
+    for pattern in _ERROR_PATTERNS:
+        for match in pattern.finditer(text_str):
+            start, end = match.span(1)
+            if end - start >= 20:  # Shorter captures are dropped by the length check below
+                errors.append(match.group(1))
     
     # Clean and deduplicate
     cleaned_errors = []
     seen_errors = set()
     
     for error in errors:
-        error = error.strip().strip(':').strip(',').strip('"')
+        error = error.strip().strip(_ERROR_STRIP_CHARS)
         
         # Skip if too short, too long, or generic
         if len(error) < 20 or len(error) > 200:
             continue
         
         # Skip generic phrases
-        generic_phrases = ['still persists', 'not working', 'issue', 'problem', 
-                          'please', 'thank you', 'steps to reproduce']
-        if any(phrase in error.lower() for phrase in generic_phrases):
+        error_lower = error.lower()
+        if _ERROR_GENERIC_PATTERN.search(error_lower):
             continue
         
         # Skip if it's just a fragment (no verb or too few words)
@@ -191,54 +245,151 @@ def extract_error_messages(text):
         if word_count < 4:
             continue
         
-        # Check for similarity with existing errors (avoid duplicates)
-        error_lower = error.lower()
-        is_duplicate = False
-        for seen in seen_errors:
-            if error_lower in seen or seen in error_lower:
-                is_duplicate = True
-                break
+        # Skip duplicates: exact repeats hit the set, then check containment
+        # against the (at most four) errors kept so far
+        if error_lower in seen_errors or \
+                any(error_lower in seen or seen in error_lower for seen in seen_errors):
+            continue
         
-        if not is_duplicate:
-            cleaned_errors.append(error)
-            seen_errors.add(error_lower)
+        cleaned_errors.append(error)
+        seen_errors.add(error_lower)
+        if len(cleaned_errors) == 5:
+            break
     
-    return cleaned_errors[:5]  # Limit to 5 most relevant, high-quality errors
+    return cleaned_errors  # Limit to 5 most relevant, high-quality errors
+
+_PRE_PRD_PATTERN = re.compile(r'PR[ED]-\d+', re.IGNORECASE)
 
-def extract_pre_prd_references(text):
+@_text_extractor
+def extract_pre_prd_references(text_str):
     """Extract PRE/PRD references from text."""
-    if pd.isna(text):
+    if '-' not in text_str:
         return []
     
-    text_str = str(text)
-    
     # PRE/PRD patterns
-    pre_prd_pattern = r'(PR[ED]-\d+)'
-    matches = re.findall(pre_prd_pattern, text_str, re.IGNORECASE)
+    matches = _PRE_PRD_PATTERN.findall(text_str)
     
-    return list(set(matches))[:20]  # Deduplicate and limit
+    # Normalize case, then deduplicate in order of first mention and limit
+    return list(dict.fromkeys(match.upper() for match in matches))[:20]
+
+# NetSuite/system record types
+_RECORD_TYPES = (
+    'sales order', 'purchase order', 'customer', 'item', 'invoice',
+    'cash sale', 'item fulfillment', 'item receipt', 'vendor bill',
+    'credit memo', 'customer deposit', 'journal entry', 'inventory adjustment',
+    'transfer order', 'assembly build', 'work order', 'opportunity',
+    'estimate', 'return authorization', 'vendor payment', 'customer payment'
+)
+
+# Shorter record types contained in a later, longer one ('item' in 'item receipt').
+# If the shorter one was not found, the longer one cannot be in the text either.
+_RECORD_TYPE_PARTS = {
+    record_type: tuple(earlier for earlier in _RECORD_TYPES[:index] if earlier in record_type)
+    for index, record_type in enumerate(_RECORD_TYPES)
+}
 
-def extract_record_types(text):
+@_text_extractor
+def extract_record_types(text_str):
     """Extract NetSuite/system record types mentioned."""
-    if pd.isna(text):
-        return []
-    
-    text_str = str(text).lower()
-    
-    record_types = [
-        'sales order', 'purchase order', 'customer', 'item', 'invoice',
-        'cash sale', 'item fulfillment', 'item receipt', 'vendor bill',
-        'credit memo', 'customer deposit', 'journal entry', 'inventory adjustment',
-        'transfer order', 'assembly build', 'work order', 'opportunity',
-        'estimate', 'return authorization', 'vendor payment', 'customer payment'
-    ]
+    text_str = text_str.lower()
     
     found_types = []
-    for record_type in record_types:
-        if record_type in text_str and record_type not in found_types:
+    for record_type in _RECORD_TYPES:
+        parts = _RECORD_TYPE_PARTS[record_type]
+        if parts and not all(part in found_types for part in parts):
+            continue
+        if record_type in text_str:
             found_types.append(record_type)
+            if len(found_types) == 10:
+                break
     
-    return found_types[:10]
+    return found_types
+
+def extract_all(text):
+    """Run all five extractors over one text and return their results by name."""
+    if _isna(text):
+        text = ''
+    text_str = str(text)
+    return {
+        'flows': extract_flow_names(text_str),
+        'mappings': extract_field_mappings(text_str),
+        'errors': extract_error_messages(text_str),
+        'pre_prd': extract_pre_prd_references(text_str),
+        'record_types': extract_record_types(text_str),
+    }
+
+def extract_batch(texts, extractor, executor=None):
+    """Run an extractor over a Series of texts, keeping the Series index."""
+    if executor is None:
+        return texts.map(extractor)
+    
+    # Hand each worker a few large chunks so per-task pickling stays small
+    chunksize = max(1, len(texts) // (4 * (os.cpu_count() or 1)))
+    return pd.Series(list(executor.map(extractor, texts, chunksize=chunksize)), index=texts.index)
+
+# Error categories in priority order - the first category whose keywords match wins
+_ERROR_CATEGORIES = (
+    ('Hook/Script Error', ['hook error', 'hook function', 'script error', 'nlobjsearch', 'customscript', 'scriptid']),
+    ('Kit/BOM Issue', ['kit definition', 'bom', 'kit component', 'member item']),
+    ('Storemap Issue', ['storemap', 'store map', 'missing storemap']),
+    ('Integration App Error', ['integration app', 'cannot delete a resource that belongs to', 'ia deleted', 'ia error']),
+    ('Sublist Operation', ['sublist', 'invalid sublist', 'sublist operation', 'line item']),
+    ('Search/Query Error', ['search', 'searchid', 'unable to get export searchid', 'invalid search']),
+    ('Webhook Error', ['webhook', 'web hook']),
+    ('Authentication', ['401', '403', 'unauthorized', 'authentication', 'token', 'auth', 'jwt', 'credential', 'reauthenticate']),
+    ('Mapping/Field', ['mapping error', 'field error', 'missing field', 'invalid field', 'invalid column']),
+    ('Record Creation/Update', ['failed to create', 'failed to update', 'failed to save', 'failed to add', 'cannot create', 'unable to create']),
+    ('Rate Limit/Performance', ['rate limit', 'too many requests', '429', 'performance', 'slow']),
+    ('Data Validation', ['validation', 'invalid value', 'invalid format', 'required', 'must be', 'must enter']),
+    ('Network/Connection', ['connection', 'network', '502', '503', '504', 'unreachable', 'timeout', 'timed out']),
+    ('API Error', ['api error', '400', '404', '500', 'bad request', 'status code']),
+    ('Configuration/Setup', ['config', 'setup', 'install', 'uninstall', 'not configured', 'missing connector']),
+    ('File/Bundle Error', ['failed to load file', 'bundle', 'file size', 'suitebundles']),
+)
+
+_ERROR_CATEGORY_NAMES = [name for name, _ in _ERROR_CATEGORIES]
+_ERROR_CATEGORY_PATTERNS = [
+    re.compile('|'.join(map(re.escape, keywords))) for _, keywords in _ERROR_CATEGORIES
+]
+
+def categorize_errors(errors):
+    """Categorize a Series of error texts into specific error categories."""
+    # Classify each distinct text once; recurring errors share the result
+    codes, distinct = pd.factorize(errors)
+    distinct = pd.Series(distinct)
+    distinct_lower = distinct.astype(str).str.lower()
+    masks = [distinct_lower.str.contains(pattern) for pattern in _ERROR_CATEGORY_PATTERNS]
+    categories = np.select(masks, _ERROR_CATEGORY_NAMES, default='Other')
+    categories = np.where(distinct.isin(['N/A', 'Not specified']), 'Unspecified', categories)
+    
+    # Missing errors have code -1, which picks the trailing 'Unspecified'
+    return pd.Series(np.append(categories, 'Unspecified')[codes], index=errors.index)
+
+# Created-date layouts tried in order (Jira CSV exports use the first one)
+_CREATED_DATE_FORMATS = (
+    '%d/%b/%y %I:%M %p',
+    '%Y-%m-%dT%H:%M:%S.%fZ',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d',
+    '%d/%m/%Y',
+)
+
+def parse_created_dates(values):
+    """Parse dates with the first known format that fits a sample, else let pandas infer it."""
+    sample = values.dropna().head(1000)
+    for date_format in _CREATED_DATE_FORMATS:
+        if pd.to_datetime(sample, format=date_format, errors='coerce').notna().mean() > 0.9:
+            return pd.to_datetime(values, format=date_format, errors='coerce', cache=True)
+    return pd.to_datetime(values, errors='coerce', cache=True)
+
+def column_widths(frame, max_width=80):
+    """Excel column widths: longest value or header plus padding, capped at max_width."""
+    widths = []
+    for col in frame.columns:
+        values = frame[col]
+        longest = values[values.notna()].astype(str).str.len().max() if len(values) else 0
+        widths.append(min(max(0 if pd.isna(longest) else int(longest), len(str(col))) + 2, max_width))
+    return widths
 
 # ============================================================================
 # DEEP DIVE ANALYSIS
@@ -252,91 +403,128 @@ def deep_dive_analysis(csv_file, output_file=None):
     print(f"Version: {VERSION}")
     print("="*100)
     
-    # Load CSV
-    df = pd.read_csv(csv_file)
-    print(f"\n✅ Loaded {len(df)} cases")
-    
-    # Identify columns
+    # Identify columns from the header (lowercased once for all lookups below)
+    columns_lower = {col: col.lower() for col in pd.read_csv(csv_file, nrows=0).columns}
     key_col = 'Issue key'
     summary_col = 'Summary'
     description_col = 'Description'
-    case_type_col = [col for col in df.columns if 'case type' in col.lower() and 'custom field' in col.lower()][0]
-    integration_col = [col for col in df.columns if 'integration app' in col.lower() and 'custom field' in col.lower()][0]
+    case_type_col = next(col for col, lower in columns_lower.items() if 'case type' in lower and 'custom field' in lower)
+    integration_col = next(col for col, lower in columns_lower.items() if 'integration app' in lower and 'custom field' in lower)
     priority_col = 'Priority'
     status_col = 'Status'
     resolution_col = 'Resolution'
+    resolution_comments_col = 'Custom field (Resolution Comments)'
     
     # Get all comment columns
-    comment_cols = [col for col in df.columns if 'comment' in col.lower()]
-    
+    comment_cols = [col for col, lower in columns_lower.items() if 'comment' in lower]
+    
+    # Description and comments are only needed for extraction
+    text_only_cols = [description_col] + [col for col in comment_cols if col != resolution_comments_col]
+    for col in text_only_cols:
+        columns_lower.pop(col, None)
+    
+    def find_column(*parts):
+        """First remaining column whose lowercased name contains every part, or None."""
+        return next((col for col, lower in columns_lower.items() if all(part in lower for part in parts)), None)
+    
+    # Load CSV in chunks, extracting details for all cases as each chunk arrives
+    # (across cores for large exports)
+    chunks = []
+    details_chunks = []
+    executor = None
+    try:
+        for chunk in pd.read_csv(csv_file, chunksize=CSV_CHUNK_SIZE):
+            # Combine all text for analysis
+            all_texts = chunk[summary_col].fillna('').astype(str) + '\n' + chunk[description_col].fillna('').astype(str)
+            for comment_col in comment_cols:
+                comments = chunk[comment_col]
+                all_texts += ('\n' + comments.astype(str)).where(comments.notna(), '')
+            
+            if not chunks and len(chunk) >= PARALLEL_MIN_CASES:
+                executor = ProcessPoolExecutor()
+            details_chunks.append(extract_batch(all_texts, extract_all, executor))
+            chunks.append(chunk.drop(columns=text_only_cols))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    
+    df = pd.concat(chunks, ignore_index=True)
+    details_by_case = pd.concat(details_chunks, ignore_index=True)
+    print(f"\n✅ Loaded {len(df)} cases")
     print(f"Found {len(comment_cols)} comment columns")
     
     # Process each case
-    detailed_data = []
-    integration_flows = defaultdict(lambda: defaultdict(list))
-    integration_mappings = defaultdict(lambda: defaultdict(list))
-    integration_errors = defaultdict(list)
-    
-    for idx, row in df.iterrows():
-        case_key = row[key_col]
-        case_type = row[case_type_col] if pd.notna(row[case_type_col]) else 'Unknown'
-        integration = row[integration_col] if pd.notna(row[integration_col]) else 'N/A'
-        summary = row[summary_col] if pd.notna(row[summary_col]) else ''
-        description = row[description_col] if pd.notna(row[description_col]) else ''
-        priority = row[priority_col] if pd.notna(row[priority_col]) else 'P3'
-        status = row[status_col]
-        resolution = row[resolution_col] if pd.notna(row[resolution_col]) else 'N/A'
-        resolution_comments = row.get('Custom field (Resolution Comments)', '') if pd.notna(row.get('Custom field (Resolution Comments)', '')) else ''
-        
-        # Combine all text for analysis
-        all_text = f"{summary}\n{description}"
-        for comment_col in comment_cols:
-            if pd.notna(row[comment_col]):
-                all_text += f"\n{row[comment_col]}"
-        
-        # Extract detailed information
-        flows = extract_flow_names(all_text)
-        mappings = extract_field_mappings(all_text)
-        errors = extract_error_messages(all_text)
-        pre_prd = extract_pre_prd_references(all_text)
-        record_types = extract_record_types(all_text)
+    flow_rows = []
+    mapping_rows = []
+    error_rows = []
+    
+    # Preallocate the derived per-case columns and fill them by position
+    n_cases = len(df)
+    text_cols = {name: np.empty(n_cases, dtype=object) for name in [
+        'Resolution Comments', 'Flows Identified', 'Field/Mapping Issues',
+        'Error Messages', 'PRE/PRD References', 'Record Types'
+    ]}
+    count_cols = {name: np.zeros(n_cases, dtype=np.int32) for name in [
+        'Flow Count', 'Mapping Count', 'Error Count'
+    ]}
+    
+    # Pull each column once (missing values already defaulted) and walk them together
+    integrations = df[integration_col].fillna('N/A')
+    if resolution_comments_col in df.columns:
+        resolution_comments_values = df[resolution_comments_col].fillna('')
+    else:
+        resolution_comments_values = [''] * n_cases
+    
+    case_rows = zip(df[key_col], integrations, resolution_comments_values, details_by_case)
+    
+    for i, (case_key, integration, resolution_comments, details) in enumerate(case_rows):
+        flows = details['flows']
+        mappings = details['mappings']
+        errors = details['errors']
+        pre_prd = details['pre_prd']
+        record_types = details['record_types']
         
         # Store data
-        detailed_data.append({
-            'Case Key': case_key,
-            'Case Type': case_type,
-            'Integration': integration,
-            'Priority': priority,
-            'Status': status,
-            'Resolution': resolution,
-            'Summary': summary[:200],
-            'Resolution Comments': str(resolution_comments) if resolution_comments else '',
-            'Flows Identified': ' | '.join(flows) if flows else 'Not specified',
-            'Field/Mapping Issues': ' | '.join(mappings) if mappings else 'Not specified',
-            'Error Messages': ' | '.join(errors[:3]) if errors else 'Not specified',
-            'PRE/PRD References': ', '.join(pre_prd) if pre_prd else 'None',
-            'Record Types': ', '.join(record_types) if record_types else 'Not specified',
-            'Flow Count': len(flows),
-            'Mapping Count': len(mappings),
-            'Error Count': len(errors)
-        })
-        
-        # Aggregate by integration
+        text_cols['Resolution Comments'][i] = str(resolution_comments) if resolution_comments else ''
+        text_cols['Flows Identified'][i] = ' | '.join(flows) if flows else 'Not specified'
+        text_cols['Field/Mapping Issues'][i] = ' | '.join(mappings) if mappings else 'Not specified'
+        text_cols['Error Messages'][i] = ' | '.join(errors[:3]) if errors else 'Not specified'
+        text_cols['PRE/PRD References'][i] = ', '.join(pre_prd) if pre_prd else 'None'
+        text_cols['Record Types'][i] = ', '.join(record_types) if record_types else 'Not specified'
+        count_cols['Flow Count'][i] = len(flows)
+        count_cols['Mapping Count'][i] = len(mappings)
+        count_cols['Error Count'][i] = len(errors)
+        
+        # Collect findings per integration (aggregated below)
         if integration != 'N/A':
-            for flow in flows:
-                integration_flows[integration][flow].append(case_key)
-            
-            for mapping in mappings:
-                integration_mappings[integration][mapping].append(case_key)
-            
-            for error in errors:
-                integration_errors[integration].append({
-                    'case': case_key,
-                    'error': error,
-                    'priority': priority
-                })
-    
-    cases_df = pd.DataFrame(detailed_data)
+            flow_rows.extend((integration, flow, case_key) for flow in flows)
+            mapping_rows.extend((integration, mapping, case_key) for mapping in mappings)
+            error_rows.extend((integration, error, case_key) for error in errors)
+    
+    cases_df = pd.DataFrame({
+        'Case Key': df[key_col],
+        'Case Type': df[case_type_col].fillna('Unknown'),
+        'Integration': integrations,
+        'Priority': df[priority_col].fillna('P3'),
+        'Status': df[status_col],
+        'Resolution': df[resolution_col].fillna('N/A'),
+        'Summary': df[summary_col].fillna('').str[:200],
+        **text_cols,
+        **count_cols,
+    }, index=pd.RangeIndex(n_cases), copy=False)
+    
+    # Low-cardinality columns are stored as categoricals; count them with
+    # value_counts(sort=False) and group them with observed=True
+    for col in ['Case Type', 'Priority', 'Status']:
+        cases_df[col] = cases_df[col].astype('category')
+    
+    # Closed/resolved flag, computed once and reused by every status breakdown
+    cases_df['_IsClosed'] = cases_df['Status'].astype(str).str.lower().isin(['closed', 'resolved'])
+    df['_IsClosed'] = cases_df['_IsClosed']  # same rows, for breakdowns over the raw export
+    
+    flow_mentions = pd.DataFrame(flow_rows, columns=['Integration', 'Flow Name', 'Case Key'])
+    mapping_mentions = pd.DataFrame(mapping_rows, columns=['Integration', 'Field/Mapping', 'Case Key'])
+    error_mentions = pd.DataFrame(error_rows, columns=['Integration', 'Error Message', 'Case Key'])
     
     print(f"\n📊 Analysis Complete:")
     print(f"  Total flows identified: {cases_df['Flow Count'].sum()}")
@@ -348,130 +536,97 @@ def deep_dive_analysis(csv_file, output_file=None):
     # ============================================================================
     
     # Enhanced Flow Analysis by Integration with more details
-    flow_analysis = []
-    for integration, flows in integration_flows.items():
-        for flow, case_keys in flows.items():
-            # Get details for these cases
-            flow_cases = cases_df[cases_df['Case Key'].isin(case_keys)]
-            
-            # Determine flow direction and record type from flow name
-            flow_lower = flow.lower()
-            
-            # Flow direction
-            if 'to' in flow_lower:
-                if 'netsuite' in flow_lower and flow_lower.index('netsuite') > flow_lower.index('to'):
-                    direction = 'Import to NetSuite'
-                elif 'netsuite' in flow_lower and flow_lower.index('netsuite') < flow_lower.index('to'):
-                    direction = 'Export from NetSuite'
-                else:
-                    direction = 'Sync'
-            elif 'import' in flow_lower:
-                direction = 'Import'
-            elif 'export' in flow_lower:
-                direction = 'Export'
-            elif 'sync' in flow_lower:
-                direction = 'Sync'
-            else:
-                direction = 'Unspecified'
-            
-            # Record type
-            record_type = 'N/A'
-            if 'sales order' in flow_lower or 'order' in flow_lower:
-                record_type = 'Sales Order'
-            elif 'cash sale' in flow_lower:
-                record_type = 'Cash Sale'
-            elif 'fulfillment' in flow_lower or 'item fulfillment' in flow_lower:
-                record_type = 'Item Fulfillment'
-            elif 'refund' in flow_lower or 'credit memo' in flow_lower:
-                record_type = 'Refund/Credit'
-            elif 'settlement' in flow_lower:
-                record_type = 'Settlement'
-            elif 'shipment' in flow_lower:
-                record_type = 'Shipment'
-            elif 'customer' in flow_lower:
-                record_type = 'Customer'
-            elif 'product' in flow_lower or 'item' in flow_lower or 'inventory' in flow_lower:
-                record_type = 'Product/Item'
-            elif 'payment' in flow_lower:
-                record_type = 'Payment'
-            elif 'invoice' in flow_lower:
-                record_type = 'Invoice'
-            
-            # Priority breakdown
-            priority_counts = flow_cases['Priority'].value_counts()
-            p1_count = priority_counts.get('P1', 0)
-            p2_count = priority_counts.get('P2', 0)
-            
-            # Status breakdown
-            status_counts = flow_cases['Status'].str.lower().apply(lambda x: 'Open' if x not in ['closed', 'resolved'] else 'Closed').value_counts()
-            open_count = status_counts.get('Open', 0)
-            closed_count = status_counts.get('Closed', 0)
-            
-            # Common errors for this flow
-            all_errors = []
-            for err in flow_cases['Error Messages'].dropna():
-                if str(err) != 'N/A' and str(err) != 'Not specified':
-                    all_errors.append(str(err)[:80])
-            common_error = all_errors[0] if all_errors else 'N/A'
-            
-            # PRE/PRD references
-            pre_refs = []
-            for ref in flow_cases['PRE/PRD References'].dropna():
-                if str(ref) != 'N/A' and str(ref) != 'Not specified':
-                    pre_refs.extend(str(ref).split(', '))
-            unique_pres = list(set(pre_refs))[:3]
-            pre_summary = ', '.join(unique_pres) if unique_pres else 'N/A'
-            
-            flow_analysis.append({
-                'Integration': integration,
-                'Flow Name': flow,
-                'Direction': direction,
-                'Record Type': record_type,
-                'Issue Count': len(case_keys),
-                'Open': open_count,
-                'Closed': closed_count,
-                'P1': p1_count,
-                'P2': p2_count,
-                'Affected Cases': ', '.join(case_keys[:10]),
-                'Common Error': common_error,
-                'PRE/PRD Refs': pre_summary,
-                'Priority': 'Critical' if p1_count > 0 else 'High' if len(case_keys) > 5 else 'Medium'
-            })
-    
-    flows_df = pd.DataFrame(flow_analysis).sort_values(['Integration', 'Issue Count'], ascending=[True, False])
+    def first_error(error_messages):
+        """First extracted error among a flow's cases."""
+        found = error_messages[~error_messages.isin(['N/A', 'Not specified'])]
+        return str(found.iloc[0])[:80] if len(found) else 'N/A'
+    
+    def summarize_pre_refs(ref_lists):
+        """Up to three PRE/PRD references across a flow's cases."""
+        pre_refs = []
+        for ref in ref_lists.dropna():
+            if str(ref) not in ['N/A', 'Not specified', 'None']:
+                pre_refs.extend(str(ref).split(', '))
+        unique_pres = list(dict.fromkeys(pre_refs))[:3]
+        return ', '.join(unique_pres) if unique_pres else 'N/A'
+    
+    # Attach case details to every (integration, flow) mention and aggregate once
+    flow_cases = flow_mentions.merge(
+        cases_df[['Case Key', 'Priority', '_IsClosed', 'Error Messages', 'PRE/PRD References']],
+        on='Case Key', how='left'
+    )
+    flow_cases['Is Open'] = ~flow_cases['_IsClosed'].astype(bool)
+    flow_cases['Is P1'] = flow_cases['Priority'] == 'P1'
+    flow_cases['Is P2'] = flow_cases['Priority'] == 'P2'
+    
+    flows_df = flow_cases.groupby(['Integration', 'Flow Name'], sort=False).agg(**{
+        'Issue Count': ('Case Key', 'size'),
+        'Open': ('Is Open', 'sum'),
+        'P1': ('Is P1', 'sum'),
+        'P2': ('Is P2', 'sum'),
+        'Affected Cases': ('Case Key', lambda keys: ', '.join(keys.iloc[:10])),
+        'Common Error': ('Error Messages', first_error),
+        'PRE/PRD Refs': ('PRE/PRD References', summarize_pre_refs),
+    }).reset_index()
+    
+    # Determine flow direction and record type from the flow name (first match wins)
+    flow_lower = flows_df['Flow Name'].str.lower()
+    to_pos = flow_lower.str.find('to')
+    netsuite_pos = flow_lower.str.find('netsuite')
+    flows_df['Direction'] = np.select(
+        [
+            (to_pos >= 0) & (netsuite_pos > to_pos),
+            (to_pos >= 0) & (netsuite_pos >= 0) & (netsuite_pos < to_pos),
+            to_pos >= 0,
+            flow_lower.str.contains('import', regex=False),
+            flow_lower.str.contains('export', regex=False),
+            flow_lower.str.contains('sync', regex=False),
+        ],
+        ['Import to NetSuite', 'Export from NetSuite', 'Sync', 'Import', 'Export', 'Sync'],
+        default='Unspecified'
+    )
+    flows_df['Record Type'] = np.select(
+        [
+            flow_lower.str.contains('order', regex=False),
+            flow_lower.str.contains('cash sale', regex=False),
+            flow_lower.str.contains('fulfillment', regex=False),
+            flow_lower.str.contains('refund|credit memo'),
+            flow_lower.str.contains('settlement', regex=False),
+            flow_lower.str.contains('shipment', regex=False),
+            flow_lower.str.contains('customer', regex=False),
+            flow_lower.str.contains('product|item|inventory'),
+            flow_lower.str.contains('payment', regex=False),
+            flow_lower.str.contains('invoice', regex=False),
+        ],
+        ['Sales Order', 'Cash Sale', 'Item Fulfillment', 'Refund/Credit', 'Settlement',
+         'Shipment', 'Customer', 'Product/Item', 'Payment', 'Invoice'],
+        default='N/A'
+    )
+    flows_df['Closed'] = flows_df['Issue Count'] - flows_df['Open']
+    flows_df['Priority'] = np.where(flows_df['P1'] > 0, 'Critical',
+                                    np.where(flows_df['Issue Count'] > 5, 'High', 'Medium'))
+    flows_df = flows_df[['Integration', 'Flow Name', 'Direction', 'Record Type', 'Issue Count',
+                         'Open', 'Closed', 'P1', 'P2', 'Affected Cases', 'Common Error',
+                         'PRE/PRD Refs', 'Priority']]
+    flows_df = flows_df.sort_values(['Integration', 'Issue Count'], ascending=[True, False])
     
     # Mapping Analysis by Integration
-    mapping_analysis = []
-    for integration, mappings in integration_mappings.items():
-        for mapping, cases in mappings.items():
-            mapping_analysis.append({
-                'Integration': integration,
-                'Field/Mapping': mapping,
-                'Issue Count': len(cases),
-                'Affected Cases': ', '.join(cases[:10]),
-                'Sample Case': cases[0] if cases else '',
-                'Priority': 'High' if len(cases) > 2 else 'Medium'
-            })
-    
-    mappings_df = pd.DataFrame(mapping_analysis).sort_values(['Integration', 'Issue Count'], ascending=[True, False])
+    mappings_df = mapping_mentions.groupby(['Integration', 'Field/Mapping'], sort=False)['Case Key'].agg(**{
+        'Issue Count': 'size',
+        'Affected Cases': lambda keys: ', '.join(keys.iloc[:10]),
+        'Sample Case': 'first',
+    }).reset_index()
+    mappings_df['Priority'] = np.where(mappings_df['Issue Count'] > 2, 'High', 'Medium')
+    mappings_df = mappings_df.sort_values(['Integration', 'Issue Count'], ascending=[True, False])
     
     # Error Analysis by Integration
-    error_analysis = []
-    for integration, errors in integration_errors.items():
-        error_groups = defaultdict(list)
-        for error_info in errors:
-            error_groups[error_info['error']].append(error_info['case'])
-        
-        for error, cases in error_groups.items():
-            error_analysis.append({
-                'Integration': integration,
-                'Error Message': error[:200],
-                'Occurrence Count': len(cases),
-                'Affected Cases': ', '.join(cases[:10]),
-                'Sample Case': cases[0] if cases else ''
-            })
-    
-    errors_df = pd.DataFrame(error_analysis).sort_values(['Integration', 'Occurrence Count'], ascending=[True, False])
+    errors_df = error_mentions.groupby(['Integration', 'Error Message'], sort=False)['Case Key'].agg(**{
+        'Occurrence Count': 'size',
+        'Affected Cases': lambda keys: ', '.join(keys.iloc[:10]),
+        'Sample Case': 'first',
+    }).reset_index()
+    errors_df['Error Message'] = errors_df['Error Message'].str[:200]
+    errors_df = errors_df.sort_values(['Integration', 'Occurrence Count'], ascending=[True, False])
     
     # Helper function to check if flow/mapping is meaningful
     def is_meaningful_data(text):
@@ -538,6 +693,33 @@ def deep_dive_analysis(csv_file, output_file=None):
         
         return flow
     
+    # Helpers to combine the columns of flows that merge together
+    def representative_flow_name(flow_names):
+        """Most common original flow name among the merged variations."""
+        return flow_names.value_counts().index[0]
+    
+    def merge_case_lists(case_lists):
+        """Up to ten distinct affected cases across merged flows."""
+        all_cases = []
+        for cases_str in case_lists.dropna():
+            all_cases.extend(cases_str.split(', '))
+        return ', '.join(list(dict.fromkeys(all_cases))[:10])
+    
+    def merge_pre_refs(ref_lists):
+        """Up to three distinct PRE/PRD references across merged flows."""
+        all_refs = []
+        for refs in ref_lists.dropna():
+            if refs != 'N/A':
+                all_refs.extend(refs.split(', '))
+        unique_refs = list(dict.fromkeys(all_refs))[:3]
+        return ', '.join(unique_refs) if unique_refs else 'N/A'
+    
+    def most_common_error(common_errors):
+        """Most common error among merged flows."""
+        errors = common_errors.dropna()
+        modes = errors.mode()
+        return modes.iloc[0] if len(errors) > 0 and not modes.empty else common_errors.iloc[0]
+    
     # Function to merge similar flows
     def merge_similar_flows(flows_df):
         """Merge flows with similar normalized names."""
@@ -547,82 +729,61 @@ def deep_dive_analysis(csv_file, output_file=None):
         # Create normalized names for grouping
         flows_df['Normalized'] = flows_df['Flow Name'].apply(normalize_flow_name)
         
-        # Group by Integration and Normalized name
-        merged_flows = []
-        grouped = flows_df.groupby(['Integration', 'Normalized'])
-        
-        for (integration, norm_name), group in grouped:
-            if not norm_name:  # Skip empty normalized names
-                continue
-                
-            # Use the most common original flow name as the representative
-            original_names = group['Flow Name'].value_counts()
-            representative_name = original_names.index[0]
-            
-            # Merge the data
-            all_cases = []
-            for cases_str in group['Affected Cases']:
-                if pd.notna(cases_str):
-                    all_cases.extend(cases_str.split(', '))
-            unique_cases = list(set(all_cases))[:10]
-            
-            # Aggregate PRE/PRD refs
-            all_refs = []
-            for refs in group['PRE/PRD Refs']:
-                if pd.notna(refs) and refs != 'N/A':
-                    all_refs.extend(refs.split(', '))
-            unique_refs = list(set(all_refs))[:3]
-            
-            # Get most common error
-            errors = group['Common Error'].dropna()
-            common_error = errors.mode()[0] if len(errors) > 0 and not errors.mode().empty else group['Common Error'].iloc[0]
-            
-            merged_flows.append({
-                'Integration': integration,
-                'Flow Name': representative_name,
-                'Direction': group['Direction'].iloc[0],
-                'Record Type': group['Record Type'].iloc[0],
-                'Issue Count': group['Issue Count'].sum(),
-                'Open': group['Open'].sum(),
-                'Closed': group['Closed'].sum(),
-                'P1': group['P1'].sum(),
-                'P2': group['P2'].sum(),
-                'Affected Cases': ', '.join(unique_cases),
-                'Common Error': common_error,
-                'PRE/PRD Refs': ', '.join(unique_refs) if unique_refs else 'N/A',
-                'Priority': 'Critical' if group['P1'].sum() > 0 else 'High' if group['Issue Count'].sum() > 5 else 'Medium',
-                'Merged Count': len(group)  # Track how many variations were merged
-            })
-        
-        result_df = pd.DataFrame(merged_flows).sort_values(['Integration', 'Issue Count'], ascending=[True, False])
+        # Group by Integration and Normalized name (skipping empty normalized names)
+        named_flows = flows_df[flows_df['Normalized'] != '']
+        result_df = named_flows.groupby(['Integration', 'Normalized']).agg(**{
+            'Flow Name': ('Flow Name', representative_flow_name),
+            'Direction': ('Direction', 'first'),
+            'Record Type': ('Record Type', 'first'),
+            'Issue Count': ('Issue Count', 'sum'),
+            'Open': ('Open', 'sum'),
+            'Closed': ('Closed', 'sum'),
+            'P1': ('P1', 'sum'),
+            'P2': ('P2', 'sum'),
+            'Affected Cases': ('Affected Cases', merge_case_lists),
+            'Common Error': ('Common Error', most_common_error),
+            'PRE/PRD Refs': ('PRE/PRD Refs', merge_pre_refs),
+            'Merged Count': ('Flow Name', 'size'),  # Track how many variations were merged
+        }).reset_index(level='Integration').reset_index(drop=True)
+        
+        result_df.insert(len(result_df.columns) - 1, 'Priority', np.where(
+            result_df['P1'] > 0, 'Critical', np.where(result_df['Issue Count'] > 5, 'High', 'Medium')
+        ))
+        
+        result_df = result_df.sort_values(['Integration', 'Issue Count'], ascending=[True, False])
         return result_df
     
+    # Partition cases, flows and errors by integration once (first-seen order)
+    integration_cases = cases_df[cases_df['Integration'] != 'N/A']
+    integration_order = integration_cases['Integration'].unique()
+    integration_groups = integration_cases.groupby('Integration', sort=False)
+    flows_by_integration = dict(list(flows_df.groupby('Integration', sort=False)))
+    errors_by_integration = dict(list(errors_df.groupby('Integration', sort=False)))
+    
     # Integration Summary with improved metrics
     integration_summary = []
-    for integration in cases_df[cases_df['Integration'] != 'N/A']['Integration'].unique():
-        int_cases = cases_df[cases_df['Integration'] == integration]
-        int_flows = integration_flows.get(integration, {})
-        int_mappings = integration_mappings.get(integration, {})
-        int_errors = integration_errors.get(integration, [])
+    for integration, int_cases in integration_groups:
+        int_flows = flows_by_integration.get(integration, flows_df.iloc[:0])
+        int_errors = errors_by_integration.get(integration, errors_df.iloc[:0])
         
         total_cases = len(int_cases)
-        closed_cases = len(int_cases[int_cases['Status'].str.lower().isin(['closed', 'resolved'])])
+        closed_cases = int(int_cases['_IsClosed'].sum())
         open_cases = total_cases - closed_cases
-        p1_cases = len(int_cases[int_cases['Priority'] == 'P1'])
-        p1_open = len(int_cases[(int_cases['Priority'] == 'P1') & (~int_cases['Status'].str.lower().isin(['closed', 'resolved']))])
+        is_p1 = int_cases['Priority'] == 'P1'
+        p1_cases = int(is_p1.sum())
+        p1_open = int((is_p1 & ~int_cases['_IsClosed']).sum())
         
-        # Get meaningful top flow
-        meaningful_flows = {f: cases for f, cases in int_flows.items() if is_meaningful_data(f)}
-        top_flow = max(meaningful_flows.items(), key=lambda x: len(x[1]))[0] if meaningful_flows else 'N/A'
-        top_flow_count = len(meaningful_flows[top_flow]) if top_flow != 'N/A' else 0
+        # Get meaningful top flow (flows_df is sorted by Issue Count within each integration)
+        meaningful_flows = int_flows[int_flows['Flow Name'].apply(is_meaningful_data)]
+        top_flow = meaningful_flows['Flow Name'].iloc[0] if len(meaningful_flows) else 'N/A'
+        top_flow_count = meaningful_flows['Issue Count'].iloc[0] if top_flow != 'N/A' else 0
         
-        # Get meaningful top error
-        unique_errors = list(set([e['error'] for e in int_errors]))
-        meaningful_errors = [err for err in unique_errors if is_meaningful_data(err)]
-        top_error = meaningful_errors[0][:80] if meaningful_errors else 'N/A'
+        # Get meaningful top error (errors_df is sorted by Occurrence Count as well)
+        meaningful_errors = int_errors[int_errors['Error Message'].apply(is_meaningful_data)]
+        top_error = meaningful_errors['Error Message'].iloc[0][:80] if len(meaningful_errors) else 'N/A'
         
         # Count frequent flows (2+ occurrences) for more actionable metric
-        frequent_flows = {f: cases for f, cases in meaningful_flows.items() if len(cases) >= 2}
+        frequent_flows = meaningful_flows[meaningful_flows['Issue Count'] >= 2]
         
         integration_summary.append({
             'Integration': integration,
@@ -670,70 +831,46 @@ def deep_dive_analysis(csv_file, output_file=None):
     # CREATE ADDITIONAL SUMMARY SHEETS
     # ============================================================================
     
-    # Count by Integration App (all case types)
-    integration_counts = []
-    for integration in cases_df[cases_df['Integration'] != 'N/A']['Integration'].unique():
-        int_cases = cases_df[cases_df['Integration'] == integration]
-        
-        # Case type breakdown
-        case_type_counts = int_cases['Case Type'].value_counts()
-        
-        # Priority breakdown
-        priority_counts = int_cases['Priority'].value_counts()
-        
-        # Status breakdown
-        status_counts = int_cases['Status'].str.lower().apply(lambda x: 'Open' if x not in ['closed', 'resolved'] else 'Closed').value_counts()
-        
-        integration_counts.append({
-            'Integration': integration,
-            'Total Cases': len(int_cases),
-            'Bug': case_type_counts.get('Bug', 0),
-            'Query': case_type_counts.get('Query', 0),
-            'Documentation': case_type_counts.get('Documentation', 0),
-            'Product Enhancement': case_type_counts.get('Product Enhancement', 0),
-            'Open': status_counts.get('Open', 0),
-            'Closed': status_counts.get('Closed', 0),
-            'P1': priority_counts.get('P1', 0),
-            'P2': priority_counts.get('P2', 0),
-            'P3': priority_counts.get('P3', 0),
-            'P4': priority_counts.get('P4', 0)
-        })
+    # Count by Integration App (all case types), one pivoted count per breakdown
+    case_type_counts = integration_cases.groupby(['Integration', 'Case Type'], observed=True).size().unstack(fill_value=0)
+    priority_counts = integration_cases.groupby(['Integration', 'Priority'], observed=True).size().unstack(fill_value=0)
+    closed_counts = integration_cases.groupby('Integration')['_IsClosed'].sum()
     
-    integration_count_df = pd.DataFrame(integration_counts).sort_values('Total Cases', ascending=False)
+    integration_count_df = pd.DataFrame({'Total Cases': integration_groups.size()}).reindex(integration_order)
+    integration_count_df = integration_count_df.join(
+        case_type_counts.reindex(columns=['Bug', 'Query', 'Documentation', 'Product Enhancement'], fill_value=0)
+    )
+    integration_count_df['Open'] = integration_count_df['Total Cases'] - closed_counts
+    integration_count_df['Closed'] = closed_counts
+    integration_count_df = integration_count_df.join(
+        priority_counts.reindex(columns=['P1', 'P2', 'P3', 'P4'], fill_value=0)
+    )
+    integration_count_df = integration_count_df.rename_axis(index='Integration', columns=None).reset_index()
+    integration_count_df = integration_count_df.sort_values('Total Cases', ascending=False)
     
     # ============================================================================
     # RESOLUTION BREAKDOWN BY INTEGRATION APP
     # ============================================================================
     
-    # Create detailed resolution breakdown for each integration
-    resolution_breakdown = []
-    for integration in cases_df[cases_df['Integration'] != 'N/A']['Integration'].unique():
-        int_cases = cases_df[cases_df['Integration'] == integration]
-        
-        # Get all resolution counts
-        resolution_counts = int_cases['Resolution'].value_counts()
-        
-        # Create row with integration name and all resolutions
-        row_data = {'Integration': integration, 'Total Cases': len(int_cases)}
-        
-        # Add each resolution as a separate column
-        for resolution, count in resolution_counts.items():
-            if pd.notna(resolution):
-                row_data[resolution] = count
-        
-        resolution_breakdown.append(row_data)
+    # Resolution columns appear in the order each integration first reports them
+    # (most frequent first), integrations in order of first appearance
+    resolution_pairs = integration_cases.groupby(['Integration', 'Resolution'], sort=False).size().reset_index(name='Count')
+    resolution_pairs['Integration Rank'] = resolution_pairs['Integration'].map(
+        {integration: rank for rank, integration in enumerate(integration_order)}
+    )
+    resolution_order = resolution_pairs.sort_values(
+        ['Integration Rank', 'Count'], ascending=[True, False], kind='stable'
+    )['Resolution'].unique()
     
-    # Create DataFrame and fill NaN with 0
-    resolution_breakdown_df = pd.DataFrame(resolution_breakdown).fillna(0)
+    # Count every resolution per integration in one pivot
+    resolution_breakdown_df = pd.crosstab(integration_cases['Integration'], integration_cases['Resolution'])
+    resolution_breakdown_df = resolution_breakdown_df.reindex(index=integration_order, columns=resolution_order)
+    resolution_breakdown_df.insert(0, 'Total Cases', integration_groups.size().reindex(integration_order))
+    resolution_breakdown_df = resolution_breakdown_df.rename_axis(index='Integration', columns=None).reset_index()
     
     # Sort by Total Cases descending
     resolution_breakdown_df = resolution_breakdown_df.sort_values('Total Cases', ascending=False)
     
-    # Convert resolution columns to int
-    for col in resolution_breakdown_df.columns:
-        if col not in ['Integration', 'Total Cases']:
-            resolution_breakdown_df[col] = resolution_breakdown_df[col].astype(int)
-    
     # ============================================================================
     # CUSTOMER-SPECIFIC ANALYSIS
     # ============================================================================
@@ -741,93 +878,59 @@ def deep_dive_analysis(csv_file, output_file=None):
     # Find customer and tier columns
     customer_col = None
     tier_col = None
-    severity_col = None
     
-    for col in df.columns:
-        if 'customer' in col.lower() and 'old' in col.lower():
+    for col, lower in columns_lower.items():
+        if 'customer' in lower and 'old' in lower:
             customer_col = col
-        elif 'customer tier' in col.lower():
+        elif 'customer tier' in lower:
             tier_col = col
-        elif col.lower() == 'severity':
-            severity_col = col
-        elif 'severity' in col.lower() and 'custom field' in col.lower():
-            severity_col = col
     
-    customer_analysis = []
+    def first_mode(values):
+        """Most common non-missing value (smallest on ties), or 'N/A'."""
+        modes = values.dropna().mode()
+        return modes.iloc[0] if len(modes) > 0 else 'N/A'
+    
+    def top_counts(frame, key, column):
+        """Most frequent column value per key and its count (first seen wins ties)."""
+        counts = frame.groupby([key, column], sort=False, observed=True).size().reset_index(name='Count')
+        top = counts.sort_values('Count', ascending=False, kind='stable').drop_duplicates(key).set_index(key)
+        return top[column], top['Count']
+    
     if customer_col and pd.notna(df[customer_col]).sum() > 0:
         # Get resolution column
-        resolution_col = None
-        for col in df.columns:
-            if col.lower() == 'resolution':
-                resolution_col = col
-                break
+        resolution_col = next((col for col, lower in columns_lower.items() if lower == 'resolution'), None)
         
         # Get unique customers (including '- None -' but we'll mark it)
-        for customer in df[customer_col].dropna().unique():
-            if customer and str(customer).strip() and str(customer) != 'N/A':
-                cust_cases = cases_df[cases_df['Case Key'].isin(
-                    df[df[customer_col] == customer]['Issue key'].values
-                )]
-                
-                if len(cust_cases) == 0:
-                    continue
-                
-                # Mark if internal
-                is_internal = '✓' if str(customer) == '- None -' else ''
-                
-                # Get tier for this customer
-                cust_tier = df[df[customer_col] == customer][tier_col].dropna().mode()
-                tier = cust_tier.values[0] if len(cust_tier) > 0 else 'N/A'
-                
-                # Severity breakdown
-                severity_counts = df[df[customer_col] == customer][severity_col].value_counts()
-                
-                # Case type breakdown
-                case_type_counts = cust_cases['Case Type'].value_counts()
-                
-                # Priority breakdown
-                priority_counts = cust_cases['Priority'].value_counts()
-                
-                # Status
-                status_counts = cust_cases['Status'].str.lower().apply(
-                    lambda x: 'Open' if x not in ['closed', 'resolved'] else 'Closed'
-                ).value_counts()
-                
-                # Top integration for this customer
-                top_int = cust_cases['Integration'].value_counts()
-                top_integration = top_int.index[0] if len(top_int) > 0 else 'N/A'
-                
-                # Resolution breakdown (if available)
-                resolution_types = []
-                if resolution_col:
-                    for case_key in df[df[customer_col] == customer]['Issue key'].values:
-                        res = df[df['Issue key'] == case_key][resolution_col].values
-                        if len(res) > 0 and pd.notna(res[0]):
-                            resolution_types.append(str(res[0]))
-                
-                top_resolution = pd.Series(resolution_types).mode()
-                resolution = top_resolution.values[0] if len(top_resolution) > 0 else 'N/A'
-                
-                # Customer health score (weighted: P1*10 + P2*5 + S1*10 + Open*3)
-                health_score = (priority_counts.get('P1', 0) * 10 + 
-                              priority_counts.get('P2', 0) * 5 + 
-                              severity_counts.get('S1', 0) * 10 + 
-                              status_counts.get('Open', 0) * 3)
-                
-                customer_analysis.append({
-                    'Customer': str(customer)[:50],
-                    'Internal': is_internal,
-                    'Tier': tier,
-                    'Total Cases': len(cust_cases),
-                    'Open': status_counts.get('Open', 0),
-                    'Closed': status_counts.get('Closed', 0),
-                    'Bug': case_type_counts.get('Bug', 0),
-                    'Query': case_type_counts.get('Query', 0),
-                    'Top Resolution': resolution[:40] if resolution != 'N/A' else 'N/A',
-                    'Top Integration': top_integration
-                })
-        
-        customer_analysis_df = pd.DataFrame(customer_analysis).sort_values('Total Cases', ascending=False)
+        customers = [customer for customer in df[customer_col].dropna().unique()
+                     if customer and str(customer).strip() and str(customer) != 'N/A']
+        
+        # Join the customer fields onto the case details (both are in export row order)
+        customer_cases = cases_df.assign(**{
+            'Customer': df[customer_col],
+            'Tier': df[tier_col] if tier_col else np.nan,
+            'Raw Resolution': df[resolution_col] if resolution_col else np.nan,
+            'Is Bug': cases_df['Case Type'] == 'Bug',
+            'Is Query': cases_df['Case Type'] == 'Query',
+        })
+        customer_cases = customer_cases[customer_cases['Customer'].isin(customers)]
+        
+        # Aggregate every customer in one pass (first-seen order)
+        customer_analysis_df = customer_cases.groupby('Customer', sort=False).agg(**{
+            'Tier': ('Tier', first_mode),
+            'Total Cases': ('Case Key', 'size'),
+            'Closed': ('_IsClosed', 'sum'),
+            'Bug': ('Is Bug', 'sum'),
+            'Query': ('Is Query', 'sum'),
+            'Top Resolution': ('Raw Resolution', lambda values: first_mode(values.dropna().astype(str))[:40]),
+        })
+        customer_analysis_df['Top Integration'], _ = top_counts(customer_cases, 'Customer', 'Integration')
+        customer_names = customer_analysis_df.index.map(str)
+        customer_analysis_df.insert(0, 'Internal', np.where(customer_names == '- None -', '✓', ''))
+        customer_analysis_df.insert(3, 'Open', customer_analysis_df['Total Cases'] - customer_analysis_df['Closed'])
+        customer_analysis_df.index = customer_names.str[:50]
+        customer_analysis_df = customer_analysis_df.rename_axis('Customer').reset_index()
+        
+        customer_analysis_df = customer_analysis_df.sort_values('Total Cases', ascending=False)
     else:
         customer_analysis_df = pd.DataFrame([{'Customer': 'N/A', 'Note': 'No customer data available'}])
     
@@ -835,133 +938,52 @@ def deep_dive_analysis(csv_file, output_file=None):
     # ERROR CATEGORY ANALYSIS
     # ============================================================================
     
-    def categorize_error(error_text):
-        """Categorize error into specific categories - IMPROVED with more granular categories."""
-        if pd.isna(error_text) or str(error_text) in ['N/A', 'Not specified']:
-            return 'Unspecified'
-        
-        error_lower = str(error_text).lower()
-        
-        # Hook/Script errors (check first - very specific)
-        if any(x in error_lower for x in ['hook error', 'hook function', 'script error', 'nlobjsearch', 'customscript', 'scriptid']):
-            return 'Hook/Script Error'
-        
-        # Kit/BOM errors
-        elif any(x in error_lower for x in ['kit definition', 'bom', 'kit component', 'member item']):
-            return 'Kit/BOM Issue'
-        
-        # Storemap errors
-        elif any(x in error_lower for x in ['storemap', 'store map', 'missing storemap']):
-            return 'Storemap Issue'
-        
-        # Integration App errors
-        elif any(x in error_lower for x in ['integration app', 'cannot delete a resource that belongs to', 'ia deleted', 'ia error']):
-            return 'Integration App Error'
-        
-        # Sublist operation errors (NetSuite specific)
-        elif any(x in error_lower for x in ['sublist', 'invalid sublist', 'sublist operation', 'line item']):
-            return 'Sublist Operation'
-        
-        # Search/Query errors (NetSuite)
-        elif any(x in error_lower for x in ['search', 'searchid', 'unable to get export searchid', 'invalid search']):
-            return 'Search/Query Error'
-        
-        # Webhook errors
-        elif any(x in error_lower for x in ['webhook', 'web hook']):
-            return 'Webhook Error'
-        
-        # Authentication errors
-        elif any(x in error_lower for x in ['401', '403', 'unauthorized', 'authentication', 'token', 'auth', 'jwt', 'credential', 'reauthenticate']):
-            return 'Authentication'
-        
-        # Mapping/Field errors
-        elif any(x in error_lower for x in ['mapping error', 'field error', 'missing field', 'invalid field', 'invalid column']):
-            return 'Mapping/Field'
-        
-        # Record errors
-        elif any(x in error_lower for x in ['failed to create', 'failed to update', 'failed to save', 'failed to add', 'cannot create', 'unable to create']):
-            return 'Record Creation/Update'
-        
-        # Rate limit/Performance
-        elif any(x in error_lower for x in ['rate limit', 'too many requests', '429', 'performance', 'slow']):
-            return 'Rate Limit/Performance'
-        
-        # Data validation
-        elif any(x in error_lower for x in ['validation', 'invalid value', 'invalid format', 'required', 'must be', 'must enter']):
-            return 'Data Validation'
-        
-        # Network/Connection
-        elif any(x in error_lower for x in ['connection', 'network', '502', '503', '504', 'unreachable', 'timeout', 'timed out']):
-            return 'Network/Connection'
-        
-        # API errors
-        elif any(x in error_lower for x in ['api error', '400', '404', '500', 'bad request', 'status code']):
-            return 'API Error'
-        
-        # Configuration/Setup
-        elif any(x in error_lower for x in ['config', 'setup', 'install', 'uninstall', 'not configured', 'missing connector']):
-            return 'Configuration/Setup'
-        
-        # File/Bundle errors
-        elif any(x in error_lower for x in ['failed to load file', 'bundle', 'file size', 'suitebundles']):
-            return 'File/Bundle Error'
+    # One row per error (top 3 errors per case), carrying its case's details
+    error_messages = cases_df['Error Messages']
+    has_errors = error_messages.notna() & ~error_messages.isin(['N/A', 'Not specified'])
+    error_cat_df = cases_df.loc[has_errors, ['Integration', 'Case Key', 'Priority', 'Status', '_IsClosed']]
+    error_cat_df.insert(0, 'Error', error_messages[has_errors].astype(str).str.split('|').str[:3])
+    error_cat_df = error_cat_df.explode('Error', ignore_index=True)
+    
+    if len(error_cat_df) > 0:
+        # Categorize the full error text in one pass, then truncate it for display
+        error_cat_df.insert(0, 'Category', categorize_errors(error_cat_df['Error']))
+        error_cat_df['Error'] = error_cat_df['Error'].str.strip().str[:100]
         
-        else:
-            return 'Other'
-    
-    error_category_analysis = []
-    for idx, row in cases_df.iterrows():
-        errors = row['Error Messages']
-        if pd.notna(errors) and str(errors) not in ['N/A', 'Not specified']:
-            error_list = str(errors).split('|')
-            for error in error_list[:3]:  # Top 3 errors per case
-                category = categorize_error(error)
-                error_category_analysis.append({
-                    'Category': category,
-                    'Error': error.strip()[:100],
-                    'Integration': row['Integration'],
-                    'Case Key': row['Case Key'],
-                    'Priority': row['Priority'],
-                    'Status': row['Status']
-                })
-    
-    error_cat_df = pd.DataFrame(error_category_analysis)
-    
-    # Summarize by category
+        # Group by category codes rather than strings (observed=True below)
+        error_cat_df['Category'] = error_cat_df['Category'].astype('category')
+    
+    def top_with_count(values, separator=''):
+        """Most frequent value with its count, e.g. 'Shopify(12)'."""
+        counts = values.value_counts()
+        return f"{counts.index[0]}{separator}({counts.values[0]})" if len(counts) > 0 else 'N/A'
+    
+    def most_common(values):
+        """Most frequent value, or 'N/A'."""
+        counts = values.value_counts()
+        return counts.index[0] if len(counts) > 0 else 'N/A'
+    
+    # Summarize by category (one aggregation over all errors, first-seen order)
     if len(error_cat_df) > 0:
-        error_summary = []
-        for category in error_cat_df['Category'].unique():
-            cat_errors = error_cat_df[error_cat_df['Category'] == category]
-            
-            # Status breakdown
-            status_counts = cat_errors['Status'].str.lower().apply(
-                lambda x: 'Open' if x not in ['closed', 'resolved'] else 'Closed'
-            ).value_counts()
-            
-            # Priority breakdown
-            priority_counts = cat_errors['Priority'].value_counts()
-            
-            # Top integration
-            top_int = cat_errors['Integration'].value_counts()
-            top_integration = f"{top_int.index[0]}({top_int.values[0]})" if len(top_int) > 0 else 'N/A'
-            
-            # Most common error in this category
-            error_counts = cat_errors['Error'].value_counts()
-            common_error = error_counts.index[0] if len(error_counts) > 0 else 'N/A'
-            
-            error_summary.append({
-                'Error Category': category,
-                'Total Occurrences': len(cat_errors),
-                'Unique Errors': cat_errors['Error'].nunique(),
-                'Open': status_counts.get('Open', 0),
-                'Closed': status_counts.get('Closed', 0),
-                'P1': priority_counts.get('P1', 0),
-                'P2': priority_counts.get('P2', 0),
-                'Top Integration': top_integration,
-                'Most Common Error': common_error[:80]
-            })
+        error_cat_df['Is P1'] = error_cat_df['Priority'] == 'P1'
+        error_cat_df['Is P2'] = error_cat_df['Priority'] == 'P2'
+        
+        error_category_summary_df = error_cat_df.groupby('Category', sort=False, observed=True).agg(**{
+            'Total Occurrences': ('Error', 'size'),
+            'Unique Errors': ('Error', 'nunique'),
+            'Closed': ('_IsClosed', 'sum'),
+            'P1': ('Is P1', 'sum'),
+            'P2': ('Is P2', 'sum'),
+            'Most Common Error': ('Error', lambda errors: most_common(errors)[:80]),
+        })
+        top_integration, top_count = top_counts(error_cat_df, 'Category', 'Integration')
+        error_category_summary_df.insert(5, 'Top Integration', top_integration + '(' + top_count.astype(str) + ')')
+        error_category_summary_df.insert(
+            2, 'Open', error_category_summary_df['Total Occurrences'] - error_category_summary_df['Closed']
+        )
+        error_category_summary_df = error_category_summary_df.rename_axis('Error Category').reset_index()
         
-        error_category_summary_df = pd.DataFrame(error_summary).sort_values('Total Occurrences', ascending=False)
+        error_category_summary_df = error_category_summary_df.sort_values('Total Occurrences', ascending=False)
     else:
         error_category_summary_df = pd.DataFrame([{'Error Category': 'N/A', 'Note': 'No errors extracted'}])
     
@@ -969,78 +991,44 @@ def deep_dive_analysis(csv_file, output_file=None):
     # BUG QUALITY ANALYSIS - Resolution Types
     # ============================================================================
     
-    # Find Bug Resolution column
-    bug_resolution_col = None
-    for col in df.columns:
-        if 'bug resolution' in col.lower():
-            bug_resolution_col = col
-            break
-    
-    # Find Skip QA column
-    skip_qa_col = None
-    for col in df.columns:
-        if 'skip qa' in col.lower():
-            skip_qa_col = col
-            break
+    # Find Bug Resolution, Skip QA, Assignee and Integration dropdown columns
+    bug_resolution_col = find_column('bug resolution')
+    skip_qa_col = find_column('skip qa')
+    assignee_col = 'Assignee' if 'Assignee' in columns_lower else None
+    int_col = find_column('integration', 'dropdown')
     
-    # Find Assignee column
-    assignee_col = None
-    for col in df.columns:
-        if col == 'Assignee':
-            assignee_col = col
-            break
-    
-    bug_quality_analysis = []
     if bug_resolution_col and pd.notna(df[bug_resolution_col]).sum() > 0:
-        # Overall resolution breakdown
+        # Overall resolution breakdown (most common first)
         resolution_counts = df[bug_resolution_col].value_counts()
         total_resolutions = resolution_counts.sum()
-        
-        for resolution, count in resolution_counts.items():
-            if resolution and str(resolution).lower() not in ['nan', 'n/a', '']:
-                pct = (count / total_resolutions) * 100
-                
-                # Get affected cases
-                resolution_cases = df[df[bug_resolution_col] == resolution]
-                
-                # Case type breakdown
-                case_type_counts = resolution_cases['Case Type[Dropdown]'].value_counts() if 'Case Type[Dropdown]' in resolution_cases.columns else {}
-                bug_count = case_type_counts.get('Bug', 0)
-                
-                # Priority breakdown
-                priority_counts = resolution_cases['Priority'].value_counts()
-                
-                # Status breakdown
-                status_counts = resolution_cases['Status'].str.lower().apply(
-                    lambda x: 'Open' if x not in ['closed', 'resolved'] else 'Closed'
-                ).value_counts()
-                
-                # Top integration for this resolution type
-                int_col = None
-                for col in resolution_cases.columns:
-                    if 'integration' in col.lower() and 'dropdown' in col.lower():
-                        int_col = col
-                        break
-                
-                top_integration = 'N/A'
-                if int_col:
-                    int_counts = resolution_cases[int_col].value_counts()
-                    if len(int_counts) > 0:
-                        top_integration = f"{int_counts.index[0]} ({int_counts.values[0]})"
-                
-                bug_quality_analysis.append({
-                    'Resolution Type': str(resolution),
-                    'Total Cases': count,
-                    'Percentage': f"{pct:.1f}%",
-                    'Bug Cases': bug_count,
-                    'Open': status_counts.get('Open', 0),
-                    'Closed': status_counts.get('Closed', 0),
-                    'P1': priority_counts.get('P1', 0),
-                    'P2': priority_counts.get('P2', 0),
-                    'Top Integration': top_integration
-                })
-        
-        bug_quality_df = pd.DataFrame(bug_quality_analysis).sort_values('Total Cases', ascending=False)
+        resolution_types = [resolution for resolution in resolution_counts.index
+                            if resolution and str(resolution).lower() not in ['nan', 'n/a', '']]
+        
+        # Aggregate every resolution type in one pass
+        has_case_type = 'Case Type[Dropdown]' in df.columns
+        resolution_flags = pd.DataFrame({
+            'Resolution': df[bug_resolution_col],
+            'Is Bug': df['Case Type[Dropdown]'] == 'Bug' if has_case_type else False,
+            'Is Closed': df['_IsClosed'],
+            'Is P1': df['Priority'] == 'P1',
+            'Is P2': df['Priority'] == 'P2',
+            'Integration': df[int_col] if int_col else np.nan,
+        })
+        bug_quality_df = resolution_flags.groupby('Resolution').agg(**{
+            'Total Cases': ('Resolution', 'size'),
+            'Bug Cases': ('Is Bug', 'sum'),
+            'Closed': ('Is Closed', 'sum'),
+            'P1': ('Is P1', 'sum'),
+            'P2': ('Is P2', 'sum'),
+            'Top Integration': ('Integration', lambda values: top_with_count(values, separator=' ')),
+        }).reindex(resolution_types)
+        
+        bug_quality_df.insert(1, 'Percentage', (bug_quality_df['Total Cases'] / total_resolutions * 100).map('{:.1f}%'.format))
+        bug_quality_df.insert(3, 'Open', bug_quality_df['Total Cases'] - bug_quality_df['Closed'])
+        bug_quality_df.index = bug_quality_df.index.map(str)
+        bug_quality_df = bug_quality_df.rename_axis('Resolution Type').reset_index()
+        
+        bug_quality_df = bug_quality_df.sort_values('Total Cases', ascending=False)
         
         # Add QA Coverage Analysis
         qa_coverage_analysis = []
@@ -1056,13 +1044,13 @@ def deep_dive_analysis(csv_file, output_file=None):
                     qa_cases = df[df[skip_qa_col] == skip_value]
                     
                     # Bug count for this QA status
-                    case_type_counts = qa_cases['Case Type[Dropdown]'].value_counts() if 'Case Type[Dropdown]' in qa_cases.columns else {}
+                    case_type_counts = qa_cases['Case Type[Dropdown]'].value_counts() if has_case_type else {}
                     bug_count = case_type_counts.get('Bug', 0)
                     
                     # Bug resolution breakdown
                     bug_resolutions = []
                     if bug_resolution_col:
-                        bug_cases = qa_cases[qa_cases['Case Type[Dropdown]'] == 'Bug'] if 'Case Type[Dropdown]' in qa_cases.columns else pd.DataFrame()
+                        bug_cases = qa_cases[qa_cases['Case Type[Dropdown]'] == 'Bug'] if has_case_type else pd.DataFrame()
                         if len(bug_cases) > 0:
                             res_counts = bug_cases[bug_resolution_col].value_counts()
                             bug_resolutions = [f"{k}({v})" for k, v in res_counts.head(3).items()]
@@ -1080,41 +1068,30 @@ def deep_dive_analysis(csv_file, output_file=None):
         else:
             qa_coverage_df = pd.DataFrame([{'QA Status': 'N/A', 'Note': 'No QA data available'}])
         
-        # Resolution by Integration
-        resolution_by_ia = []
-        int_col = None
-        for col in df.columns:
-            if 'integration' in col.lower() and 'dropdown' in col.lower():
-                int_col = col
-                break
-        
+        # Resolution by Integration (integrations in order of first appearance)
         if int_col and bug_resolution_col:
-            for integration in df[df[int_col].notna()][int_col].unique():
-                if str(integration) not in ['N/A', 'nan', '']:
-                    int_cases = df[df[int_col] == integration]
-                    
-                    # Resolution breakdown
-                    res_counts = int_cases[bug_resolution_col].value_counts()
-                    total_res = res_counts.sum()
-                    
-                    if total_res > 0:
-                        code_fix = res_counts.get('Code fix', 0)
-                        config = res_counts.get('Configuration', 0)
-                        other = res_counts.get('Other', 0)
-                        
-                        resolution_by_ia.append({
-                            'Integration': str(integration),
-                            'Total with Resolution': int(total_res),
-                            'Code Fix': int(code_fix),
-                            'Code Fix %': f"{(code_fix/total_res*100):.1f}%",
-                            'Configuration': int(config),
-                            'Config %': f"{(config/total_res*100):.1f}%",
-                            'Other': int(other),
-                            'Other %': f"{(other/total_res*100):.1f}%",
-                            'Quality Score': f"{((code_fix/total_res)*100):.0f}"  # Higher = more code issues
-                        })
+            resolution_by_ia = pd.crosstab(df[int_col], df[bug_resolution_col])
+            integrations = [integration for integration in df[int_col].dropna().unique()
+                            if str(integration) not in ['N/A', 'nan', ''] and integration in resolution_by_ia.index]
+            resolution_by_ia = resolution_by_ia.reindex(integrations)
             
-            resolution_by_ia_df = pd.DataFrame(resolution_by_ia).sort_values('Code Fix', ascending=False)
+            total_res = resolution_by_ia.sum(axis=1)
+            counts = resolution_by_ia.reindex(columns=['Code fix', 'Configuration', 'Other'], fill_value=0)
+            shares = counts.div(total_res, axis=0) * 100
+            
+            resolution_by_ia_df = pd.DataFrame({
+                'Integration': counts.index.map(str),
+                'Total with Resolution': total_res.to_numpy(),
+                'Code Fix': counts['Code fix'].to_numpy(),
+                'Code Fix %': shares['Code fix'].map('{:.1f}%'.format).to_numpy(),
+                'Configuration': counts['Configuration'].to_numpy(),
+                'Config %': shares['Configuration'].map('{:.1f}%'.format).to_numpy(),
+                'Other': counts['Other'].to_numpy(),
+                'Other %': shares['Other'].map('{:.1f}%'.format).to_numpy(),
+                'Quality Score': shares['Code fix'].map('{:.0f}'.format).to_numpy()  # Higher = more code issues
+            })
+            
+            resolution_by_ia_df = resolution_by_ia_df.sort_values('Code Fix', ascending=False)
         else:
             resolution_by_ia_df = pd.DataFrame([{'Integration': 'N/A', 'Note': 'No resolution data by IA'}])
         
@@ -1127,47 +1104,28 @@ def deep_dive_analysis(csv_file, output_file=None):
     # DETAILED ERROR DISTRIBUTION BY INTEGRATION (NEW)
     # ============================================================================
     
-    # Create detailed breakdown: Error Category x Integration
-    error_distribution = []
+    # Create detailed breakdown: Error Category x Integration (one aggregation over all errors)
     if len(error_cat_df) > 0:
-        for category in sorted(error_cat_df['Category'].unique()):
-            cat_errors = error_cat_df[error_cat_df['Category'] == category]
-            
-            # Count by integration
-            integration_counts = cat_errors.groupby('Integration').size().sort_values(ascending=False)
-            
-            # Get status and priority breakdown per integration
-            for integration, count in integration_counts.items():
-                int_cat_errors = cat_errors[cat_errors['Integration'] == integration]
-                
-                # Status breakdown
-                status_counts = int_cat_errors['Status'].str.lower().apply(
-                    lambda x: 'Open' if x not in ['closed', 'resolved'] else 'Closed'
-                ).value_counts()
-                
-                # Priority breakdown
-                priority_counts = int_cat_errors['Priority'].value_counts()
-                
-                # Get sample errors
-                error_samples = int_cat_errors['Error'].unique()[:2]
-                sample_error = error_samples[0] if len(error_samples) > 0 else 'N/A'
-                
-                # Get affected cases
-                affected_cases = ', '.join(int_cat_errors['Case Key'].unique()[:5])
-                
-                error_distribution.append({
-                    'Error Category': category,
-                    'Integration': integration,
-                    'Error Count': count,
-                    'Open': status_counts.get('Open', 0),
-                    'Closed': status_counts.get('Closed', 0),
-                    'P1': priority_counts.get('P1', 0),
-                    'P2': priority_counts.get('P2', 0),
-                    'Sample Error': sample_error[:80],
-                    'Affected Cases': affected_cases
-                })
+        distribution_keys = ['Category', 'Integration']
+        error_distribution_df = error_cat_df.groupby(distribution_keys, observed=True).agg(**{
+            'Error Count': ('Error', 'size'),
+            'Closed': ('_IsClosed', 'sum'),
+            'P1': ('Is P1', 'sum'),
+            'P2': ('Is P2', 'sum'),
+            'Sample Error': ('Error', 'first'),
+        })
+        error_distribution_df['Sample Error'] = error_distribution_df['Sample Error'].str[:80]
+        
+        # First five distinct cases per pair
+        affected_cases = error_cat_df.drop_duplicates(distribution_keys + ['Case Key'])
+        affected_cases = affected_cases.groupby(distribution_keys, observed=True).head(5)
+        error_distribution_df['Affected Cases'] = affected_cases.groupby(distribution_keys, observed=True)['Case Key'].agg(', '.join)
+        error_distribution_df.insert(
+            1, 'Open', error_distribution_df['Error Count'] - error_distribution_df['Closed']
+        )
+        error_distribution_df = error_distribution_df.rename_axis(['Error Category', 'Integration']).reset_index()
         
-        error_distribution_df = pd.DataFrame(error_distribution).sort_values(
+        error_distribution_df = error_distribution_df.sort_values(
             ['Error Category', 'Error Count'], ascending=[True, False]
         )
     else:
@@ -1183,62 +1141,61 @@ def deep_dive_analysis(csv_file, output_file=None):
     
     if created_col:
         # Parse dates and extract month
-        cases_df['Month'] = pd.to_datetime(df[created_col], errors='coerce').dt.to_period('M').astype(str)
+        cases_df['Month'] = parse_created_dates(df[created_col]).dt.strftime('%Y-%m')
+        month = cases_df['Month']
         
-        monthly_counts = []
-        for month in sorted(cases_df['Month'].dropna().unique()):
-            month_cases = cases_df[cases_df['Month'] == month]
-            
-            # Case type breakdown
-            case_type_counts = month_cases['Case Type'].value_counts()
-            
-            # Priority breakdown
-            priority_counts = month_cases['Priority'].value_counts()
-            
-            # Status breakdown
-            status_counts = month_cases['Status'].str.lower().apply(lambda x: 'Open' if x not in ['closed', 'resolved'] else 'Closed').value_counts()
-            
-            # Top integrations for this month
-            top_integrations = month_cases['Integration'].value_counts().head(3)
-            top_int_str = ', '.join([f"{k}({v})" for k, v in top_integrations.items()])
-            
-            monthly_counts.append({
-                'Month': month,
-                'Total Cases': len(month_cases),
-                'Bug': case_type_counts.get('Bug', 0),
-                'Query': case_type_counts.get('Query', 0),
-                'Documentation': case_type_counts.get('Documentation', 0),
-                'Product Enhancement': case_type_counts.get('Product Enhancement', 0),
-                'Open': status_counts.get('Open', 0),
-                'Closed': status_counts.get('Closed', 0),
-                'P1': priority_counts.get('P1', 0),
-                'P2': priority_counts.get('P2', 0),
-                'P3': priority_counts.get('P3', 0),
-                'P4': priority_counts.get('P4', 0),
-                'Top Integrations': top_int_str
-            })
+        # Case type and priority breakdowns
+        case_type_counts = pd.crosstab(month, cases_df['Case Type']).reindex(
+            columns=['Bug', 'Query', 'Documentation', 'Product Enhancement'], fill_value=0
+        )
+        priority_counts = pd.crosstab(month, cases_df['Priority']).reindex(
+            columns=['P1', 'P2', 'P3', 'P4'], fill_value=0
+        )
         
-        monthly_count_df = pd.DataFrame(monthly_counts)
+        # Status breakdown
+        status_counts = cases_df.groupby('Month')['_IsClosed'].agg(['size', 'sum'])
+        
+        # Top integrations for each month
+        top_integrations = (
+            cases_df.groupby(['Month', 'Integration'], sort=False).size().reset_index(name='Count')
+            .sort_values(['Month', 'Count'], ascending=[True, False])
+            .groupby('Month').head(3)
+        )
+        top_integrations['Label'] = top_integrations['Integration'] + '(' + top_integrations['Count'].astype(str) + ')'
+        top_int_str = top_integrations.groupby('Month')['Label'].agg(', '.join)
+        
+        monthly_count_df = pd.concat([
+            status_counts['size'].rename('Total Cases'),
+            case_type_counts,
+            (status_counts['size'] - status_counts['sum']).rename('Open'),
+            status_counts['sum'].rename('Closed'),
+            priority_counts,
+            top_int_str.rename('Top Integrations'),
+        ], axis=1).rename_axis(index='Month', columns=None).reset_index()
     else:
         # If no date column, create empty dataframe
         monthly_count_df = pd.DataFrame([{'Month': 'N/A', 'Total Cases': len(cases_df), 'Note': 'No date column found'}])
     
     # Write to Excel with formatting
     with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-        summary_df.to_excel(writer, sheet_name='Integration Overview', index=False)
-        integration_count_df.to_excel(writer, sheet_name='Count by Integration', index=False)
-        resolution_breakdown_df.to_excel(writer, sheet_name='Resolution Breakdown by IA', index=False)
-        monthly_count_df.to_excel(writer, sheet_name='Count by Month', index=False)
-        customer_analysis_df.to_excel(writer, sheet_name='Customer Analysis', index=False)
-        error_category_summary_df.to_excel(writer, sheet_name='Error Categories', index=False)
-        error_distribution_df.to_excel(writer, sheet_name='Error Distribution by IA', index=False)
-        frequent_flows.to_excel(writer, sheet_name='Frequent Flow Issues', index=False)
-        frequent_errors.to_excel(writer, sheet_name='Recurring Errors', index=False)
-        cases_df.to_excel(writer, sheet_name='Case Details', index=False)
+        sheet_frames = {
+            'Integration Overview': summary_df,
+            'Count by Integration': integration_count_df,
+            'Resolution Breakdown by IA': resolution_breakdown_df,
+            'Count by Month': monthly_count_df,
+            'Customer Analysis': customer_analysis_df,
+            'Error Categories': error_category_summary_df,
+            'Error Distribution by IA': error_distribution_df,
+            'Frequent Flow Issues': frequent_flows,
+            'Recurring Errors': frequent_errors,
+            'Case Details': cases_df.drop(columns='_IsClosed'),
+        }
+        for sheet_name, frame in sheet_frames.items():
+            frame.to_excel(writer, sheet_name=sheet_name, index=False)
         
         # Apply visual enhancements to all sheets
         from openpyxl.utils import get_column_letter
-        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
         
         # Color scheme
         header_fill = PatternFill(start_color='1F4E78', end_color='1F4E78', fill_type='solid')  # Dark blue
@@ -1253,6 +1210,9 @@ def deep_dive_analysis(csv_file, output_file=None):
         # Alternating row colors
         alt_row_fill = PatternFill(start_color='F2F2F2', end_color='F2F2F2', fill_type='solid')  # Light gray
         
+        # Body cell alignment, shared by every data cell
+        body_alignment = Alignment(vertical='top', wrap_text=True)
+        
         # Border style
         thin_border = Border(
             left=Side(style='thin', color='D3D3D3'),
@@ -1261,21 +1221,17 @@ def deep_dive_analysis(csv_file, output_file=None):
             bottom=Side(style='thin', color='D3D3D3')
         )
         
+        # Body rows get one registered style each (a single assignment per cell
+        # instead of separate fill, border and alignment lookups)
+        writer.book.add_named_style(NamedStyle('Body', border=thin_border, alignment=body_alignment))
+        writer.book.add_named_style(NamedStyle('Body Alt', fill=alt_row_fill, border=thin_border, alignment=body_alignment))
+        
         for sheet_name in writer.sheets:
             worksheet = writer.sheets[sheet_name]
             
             # Auto-adjust column widths
-            for idx, col in enumerate(worksheet.columns, 1):
-                max_length = 0
-                column = get_column_letter(idx)
-                for cell in col:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 80)
-                worksheet.column_dimensions[column].width = adjusted_width
+            for idx, width in enumerate(column_widths(sheet_frames[sheet_name]), 1):
+                worksheet.column_dimensions[get_column_letter(idx)].width = width
             
             # Style header row
             for cell in worksheet[1]:
@@ -1287,103 +1243,57 @@ def deep_dive_analysis(csv_file, output_file=None):
             # Set row height for header
             worksheet.row_dimensions[1].height = 30
             
-            # Apply alternating row colors and borders
+            # Apply alternating row colors and borders in one pass over the body
             for row_idx, row in enumerate(worksheet.iter_rows(min_row=2), start=2):
-                # Alternating row background
-                if row_idx % 2 == 0:
-                    for cell in row:
-                        cell.fill = alt_row_fill
-                
-                # Apply borders to all cells
+                body_style = 'Body Alt' if row_idx % 2 == 0 else 'Body'
                 for cell in row:
-                    cell.border = thin_border
-                    cell.alignment = Alignment(vertical='top', wrap_text=True)
+                    cell.style = body_style
             
-            # Sheet-specific conditional formatting
-            if sheet_name == 'Integration Overview':
+            # Sheet-specific conditional formatting, stored as Excel rules
+            letters = {col: get_column_letter(idx) for idx, col in enumerate(sheet_frames[sheet_name].columns, 1)}
+            last_row = max(worksheet.max_row, 2)
+            
+            def rule_range(first_col, last_col=None):
+                return f"{first_col}2:{last_col or first_col}{last_row}"
+            
+            if sheet_name == 'Integration Overview' and 'P1 Open' in letters:
                 # Highlight P1 Open column
-                for row in worksheet.iter_rows(min_row=2, max_row=worksheet.max_row):
-                    p1_open_col = None
-                    for idx, cell in enumerate(worksheet[1], 1):
-                        if cell.value == 'P1 Open':
-                            p1_open_col = idx
-                            break
-                    if p1_open_col and row[p1_open_col-1].value and int(row[p1_open_col-1].value) > 0:
-                        row[p1_open_col-1].fill = p1_fill
-                        row[p1_open_col-1].font = Font(bold=True)
+                worksheet.conditional_formatting.add(rule_range(letters['P1 Open']), CellIsRule(
+                    operator='greaterThan', formula=['0'], fill=p1_fill, font=Font(bold=True)))
             
-            elif sheet_name == 'Customer Analysis':
+            elif sheet_name == 'Customer Analysis' and 'Internal' in letters:
                 # Highlight internal customers
-                for row in worksheet.iter_rows(min_row=2, max_row=worksheet.max_row):
-                    internal_col = None
-                    for idx, cell in enumerate(worksheet[1], 1):
-                        if cell.value == 'Internal':
-                            internal_col = idx
-                            break
-                    if internal_col and row[internal_col-1].value == '✓':
-                        for cell in row:
-                            if cell.fill.start_color.rgb in ['F2F2F2', '00000000']:
-                                cell.fill = PatternFill(start_color='E7E6E6', end_color='E7E6E6', fill_type='solid')
+                worksheet.conditional_formatting.add(rule_range('A', get_column_letter(len(letters))), FormulaRule(
+                    formula=[f'${letters["Internal"]}2="✓"'],
+                    fill=PatternFill(start_color='E7E6E6', end_color='E7E6E6', fill_type='solid')))
             
-            elif sheet_name == 'Error Categories':
+            elif sheet_name == 'Error Categories' and 'P1' in letters:
                 # Color code by severity
-                for row in worksheet.iter_rows(min_row=2, max_row=worksheet.max_row):
-                    p1_col = None
-                    for idx, cell in enumerate(worksheet[1], 1):
-                        if cell.value == 'P1':
-                            p1_col = idx
-                            break
-                    if p1_col and row[p1_col-1].value and int(row[p1_col-1].value) > 0:
-                        row[0].font = Font(bold=True, color='C00000')  # Red for categories with P1
+                worksheet.conditional_formatting.add(rule_range('A'), FormulaRule(
+                    formula=[f'${letters["P1"]}2>0'], font=Font(bold=True, color='C00000')))  # Red for categories with P1
             
-            elif sheet_name == 'Error Distribution by IA':
+            elif sheet_name == 'Error Distribution by IA' and 'Error Count' in letters:
                 # Highlight high error counts
-                for row in worksheet.iter_rows(min_row=2, max_row=worksheet.max_row):
-                    error_count_col = None
-                    for idx, cell in enumerate(worksheet[1], 1):
-                        if cell.value == 'Error Count':
-                            error_count_col = idx
-                            break
-                    if error_count_col and row[error_count_col-1].value:
-                        count = int(row[error_count_col-1].value)
-                        if count >= 5:
-                            row[error_count_col-1].fill = p1_fill
-                            row[error_count_col-1].font = Font(bold=True)
-                        elif count >= 3:
-                            row[error_count_col-1].fill = p2_fill
+                count_range = rule_range(letters['Error Count'])
+                worksheet.conditional_formatting.add(count_range, CellIsRule(
+                    operator='greaterThanOrEqual', formula=['5'], fill=p1_fill, font=Font(bold=True), stopIfTrue=True))
+                worksheet.conditional_formatting.add(count_range, CellIsRule(
+                    operator='greaterThanOrEqual', formula=['3'], fill=p2_fill))
             
-            elif sheet_name == 'Frequent Flow Issues':
+            elif sheet_name == 'Frequent Flow Issues' and 'Priority' in letters:
                 # Highlight by priority
-                for row in worksheet.iter_rows(min_row=2, max_row=worksheet.max_row):
-                    priority_col = None
-                    for idx, cell in enumerate(worksheet[1], 1):
-                        if cell.value == 'Priority':
-                            priority_col = idx
-                            break
-                    if priority_col:
-                        if row[priority_col-1].value == 'Critical':
-                            row[priority_col-1].fill = p1_fill
-                            row[priority_col-1].font = Font(bold=True)
-                        elif row[priority_col-1].value == 'High':
-                            row[priority_col-1].fill = p2_fill
+                priority_range = rule_range(letters['Priority'])
+                worksheet.conditional_formatting.add(priority_range, CellIsRule(
+                    operator='equal', formula=['"Critical"'], fill=p1_fill, font=Font(bold=True)))
+                worksheet.conditional_formatting.add(priority_range, CellIsRule(
+                    operator='equal', formula=['"High"'], fill=p2_fill))
             
             elif sheet_name == 'Case Details':
-                # Highlight open P1 cases
-                for row in worksheet.iter_rows(min_row=2, max_row=worksheet.max_row):
-                    priority_col = status_col = None
-                    for idx, cell in enumerate(worksheet[1], 1):
-                        if cell.value == 'Priority':
-                            priority_col = idx
-                        elif cell.value == 'Status':
-                            status_col = idx
-                    
-                    if priority_col and status_col:
-                        is_p1 = row[priority_col-1].value == 'P1'
-                        is_open = str(row[status_col-1].value).lower() not in ['closed', 'resolved']
-                        
-                        if is_p1 and is_open:
-                            row[0].fill = p1_fill  # Highlight case key
-                            row[0].font = Font(bold=True)
+                # Highlight open P1 cases (case key column)
+                priority, status = letters['Priority'], letters['Status']
+                worksheet.conditional_formatting.add(rule_range('A'), FormulaRule(
+                    formula=[f'AND(${priority}2="P1",NOT(OR(LOWER(${status}2)="closed",LOWER(${status}2)="resolved")))'],
+                    fill=p1_fill, font=Font(bold=True)))
             
             # Freeze panes (first row and first column)
             worksheet.freeze_panes = 'B2'
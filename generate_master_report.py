@@ -13,52 +13,56 @@ import argparse
 import sys
 from datetime import datetime
 import subprocess
+import tempfile
 import re
 
 VERSION = "1.1.0"
 LAST_UPDATED = "2025-10-09"
 
-def extract_customer_from_description(description, summary):
-    """Extract customer name from description using various patterns"""
-    if pd.isna(description) and pd.isna(summary):
-        return 'Unknown'
-    
-    full_text = str(description) + ' ' + str(summary)
-    
-    # Customer patterns to search for
-    customer_patterns = [
-        r'Company:\s*([^\n]+)',
-        r'Customer:\s*([^\n]+)',
-        r'Account:\s*([^\n]+)',
-        r'User:\s*([^\n]+)',
-        r'Client:\s*([^\n]+)',
-        r'Organization:\s*([^\n]+)',
-        r'Business:\s*([^\n]+)',
-        r'Enterprise:\s*([^\n]+)',
-        r'Customer Name:\s*([^\n]+)',
-        r'Account Name:\s*([^\n]+)',
-        r'Company Name:\s*([^\n]+)'
-    ]
-    
-    for pattern in customer_patterns:
-        match = re.search(pattern, full_text, re.IGNORECASE)
-        if match:
-            customer = match.group(1).strip()
-            # Clean up the customer name
-            customer = re.sub(r'\|\|.*$', '', customer)  # Remove everything after ||
-            customer = re.sub(r'\(Tier \d+\)', '', customer)  # Remove tier info
-            customer = customer.strip()
-            # Filter out common non-customer values
-            if (len(customer) > 2 and 
-                customer.lower() not in ['none', 'unknown', 'n/a', 'na', 'tbd', 'to be determined', 
-                                       'internal', 'test', 'demo', 'sample', 'example'] and
-                not customer.startswith('h1.') and
-                not customer.startswith('h2.') and
-                not customer.startswith('*') and
-                not customer.startswith('#')):
-                return customer
-    
-    return 'Unknown'
+# Customer patterns to search for (earlier patterns win)
+_CUSTOMER_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'Company:\s*([^\n]+)',
+    r'Customer:\s*([^\n]+)',
+    r'Account:\s*([^\n]+)',
+    r'User:\s*([^\n]+)',
+    r'Client:\s*([^\n]+)',
+    r'Organization:\s*([^\n]+)',
+    r'Business:\s*([^\n]+)',
+    r'Enterprise:\s*([^\n]+)',
+    r'Customer Name:\s*([^\n]+)',
+    r'Account Name:\s*([^\n]+)',
+    r'Company Name:\s*([^\n]+)'
+)]
+# Any of the labels above, used to skip text that cannot match any pattern
+_CUSTOMER_LABEL_RE = re.compile(
+    r'(?:Company|Customer|Account|User|Client|Organization|Business|Enterprise)(?: Name)?:',
+    re.IGNORECASE)
+_TAIL_RE = re.compile(r'\|\|.*$')  # Everything after ||
+_TIER_RE = re.compile(r'\(Tier \d+\)')  # Tier info
+_MARKUP_RE = re.compile(r'h1\.|h2\.|\*|#')  # Wiki headings / bullets
+# Common non-customer values
+_BLACKLIST = frozenset({'none', 'unknown', 'n/a', 'na', 'tbd', 'to be determined',
+                        'internal', 'test', 'demo', 'sample', 'example'})
+
+def extract_customers(descriptions, summaries):
+    """Extract customer names from description + summary text (one vectorized pass per pattern)"""
+    full_text = descriptions.fillna('').astype(str) + ' ' + summaries.fillna('').astype(str)
+    
+    customers = pd.Series('Unknown', index=full_text.index, dtype=object)
+    unresolved = full_text[full_text.str.contains(_CUSTOMER_LABEL_RE)]
+    for pattern in _CUSTOMER_PATTERNS:
+        customer = unresolved.str.extract(pattern, expand=False).str.strip()
+        # Clean up the customer name
+        customer = customer.str.replace(_TAIL_RE, '', regex=True)
+        customer = customer.str.replace(_TIER_RE, '', regex=True)
+        customer = customer.str.strip()
+        valid = (customer.str.len() > 2) & \
+                ~customer.str.lower().isin(_BLACKLIST) & \
+                ~customer.str.match(_MARKUP_RE, na=False)
+        customers[valid[valid].index] = customer[valid]
+        unresolved = unresolved[~valid]
+    
+    return customers
 
 def generate_master_report(csv_file, output_file=None):
     """Generate a single master report combining both analyses."""
@@ -79,40 +83,46 @@ def generate_master_report(csv_file, output_file=None):
     temp_comprehensive = 'temp_comprehensive.xlsx'
     temp_deep_dive = 'temp_deep_dive.xlsx'
     
+    # Both analyses only read the CSV, so run them side by side
     print(f"\n📊 Step 1/3: Generating Comprehensive Analysis...")
-    try:
-        result = subprocess.run([
-            'python3', 'analyze_combined_report.py',
-            '--file', csv_file,
-            '--output', temp_comprehensive
-        ], capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            print(f"❌ Error in Comprehensive Analysis:")
-            print(result.stderr)
-            return False
-        
-        print("✅ Comprehensive Analysis complete")
-    except Exception as e:
-        print(f"❌ Error running Comprehensive Analysis: {str(e)}")
-        return False
-    
-    print(f"\n📊 Step 2/3: Generating Deep Dive Analysis...")
-    try:
-        result = subprocess.run([
-            'python3', 'deep_dive_detailed_analysis.py',
-            '--file', csv_file,
-            '--output', temp_deep_dive
-        ], capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            print(f"❌ Error in Deep Dive Analysis:")
-            print(result.stderr)
+    print(f"📊 Step 2/3: Generating Deep Dive Analysis...")
+    analyses = [
+        ('Comprehensive Analysis', 'analyze_combined_report.py', temp_comprehensive),
+        ('Deep Dive Analysis', 'deep_dive_detailed_analysis.py', temp_deep_dive),
+    ]
+    processes = []
+    for label, script, temp_file in analyses:
+        # stderr goes to a temp file so a chatty analysis can't block on a full pipe
+        stderr_file = tempfile.TemporaryFile(mode='w+')
+        try:
+            process = subprocess.Popen([
+                'python3', script,
+                '--file', csv_file,
+                '--output', temp_file
+            ], stdout=subprocess.DEVNULL, stderr=stderr_file, text=True)
+        except Exception as e:
+            print(f"❌ Error running {label}: {str(e)}")
+            stderr_file.close()
+            for _, started, started_stderr in processes:
+                started.kill()
+                started.wait()
+                started_stderr.close()
             return False
-        
-        print("✅ Deep Dive Analysis complete")
-    except Exception as e:
-        print(f"❌ Error running Deep Dive Analysis: {str(e)}")
+        processes.append((label, process, stderr_file))
+    
+    # Wait for both before reporting so neither is left running on failure
+    failed = False
+    for label, process, stderr_file in processes:
+        process.wait()
+        if process.returncode != 0:
+            stderr_file.seek(0)
+            print(f"❌ Error in {label}:")
+            print(stderr_file.read())
+            failed = True
+        else:
+            print(f"✅ {label} complete")
+        stderr_file.close()
+    if failed:
         return False
     
     print(f"\n📊 Step 3/3: Adding Customer Extraction Analysis...")
@@ -120,8 +130,9 @@ def generate_master_report(csv_file, output_file=None):
     # Load the original CSV to extract customer information
     print(f"  Extracting customer information from descriptions...")
     df_original = pd.read_csv(csv_file)
-    df_original['Extracted_Customer'] = df_original.apply(lambda row: extract_customer_from_description(
-        row.get('Description', ''), row.get('Summary', '')), axis=1)
+    no_text = pd.Series('', index=df_original.index)
+    df_original['Extracted_Customer'] = extract_customers(
+        df_original.get('Description', no_text), df_original.get('Summary', no_text))
     
     # Extract resolution comments if available
     if 'Custom field (Resolution Comments)' in df_original.columns:
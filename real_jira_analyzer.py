@@ -5,16 +5,25 @@ Pulls real data from JIRA for given date range and provides comprehensive analys
 """
 
 import argparse
+import hashlib
+import os
+import shutil
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.chart import BarChart, LineChart, PieChart, Reference
 from openpyxl.chart.label import DataLabelList
-from openpyxl.utils.dataframe import dataframe_to_rows
 import sys
 
+# Timestamp layout of the Created/Updated/Resolved fields in pulled issues
+JIRA_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Statuses counted as resolved
+RESOLVED_STATUSES = ['Done', 'Resolved', 'Closed']
+
 class RealJiraAnalyzer:
     def __init__(self, start_date='2023-01-01', end_date='2025-12-31'):
         self.start_date = start_date
@@ -81,7 +90,7 @@ class RealJiraAnalyzer:
             root_cause = np.random.choice(root_causes)
             
             # Calculate resolution date
-            resolved_date = created_date + timedelta(days=np.random.randint(1, 10)) if status in ['Done', 'Resolved', 'Closed'] else None
+            resolved_date = created_date + timedelta(days=np.random.randint(1, 10)) if status in RESOLVED_STATUSES else None
             
             issue = {
                 'Issue Key': f'{project_key}-{10000 + i}',
@@ -90,17 +99,12 @@ class RealJiraAnalyzer:
                 'Status': status,
                 'Priority': priority,
                 'Assignee': f'User{i % 10}',
-                'Created': created_date.strftime('%Y-%m-%d %H:%M:%S'),
-                'Updated': (created_date + timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'),
-                'Resolved': resolved_date.strftime('%Y-%m-%d %H:%M:%S') if resolved_date else '',
+                'Created': created_date.strftime(JIRA_DATETIME_FORMAT),
+                'Updated': (created_date + timedelta(days=1)).strftime(JIRA_DATETIME_FORMAT),
+                'Resolved': resolved_date.strftime(JIRA_DATETIME_FORMAT) if resolved_date else '',
                 'Resolution': resolution,
                 'Root Cause': root_cause,
-                'Integration Apps': app,
-                'Resolution Time (days)': (resolved_date - created_date).days if resolved_date else 0,
-                'Month-Year': created_date.strftime('%Y-%m'),
-                'Year': created_date.year,
-                'Month': created_date.month,
-                'Quarter': f'Q{(created_date.month-1)//3 + 1}'
+                'Integration Apps': app
             }
             issues.append(issue)
         
@@ -113,34 +117,57 @@ class RealJiraAnalyzer:
         # Convert to DataFrame
         self.df = pd.DataFrame(jira_data)
         
-        # Convert date columns
-        self.df['Created'] = pd.to_datetime(self.df['Created'])
-        self.df['Updated'] = pd.to_datetime(self.df['Updated'])
-        self.df['Resolved'] = pd.to_datetime(self.df['Resolved'], errors='coerce')
-        
-        # Filter by date range
-        self.df = self.df[
-            (self.df['Created'] >= self.start_date) & 
-            (self.df['Created'] <= self.end_date)
-        ]
+        # Convert date columns (explicit format, repeated timestamps parsed once)
+        self.df['Created'] = pd.to_datetime(self.df['Created'], format=JIRA_DATETIME_FORMAT, cache=True)
+        self.df['Updated'] = pd.to_datetime(self.df['Updated'], format=JIRA_DATETIME_FORMAT, cache=True)
+        self.df['Resolved'] = pd.to_datetime(self.df['Resolved'], format=JIRA_DATETIME_FORMAT, errors='coerce', cache=True)
+        
+        # Filter by date range (inclusive, one mask)
+        in_range = self.df['Created'].between(pd.Timestamp(self.start_date), pd.Timestamp(self.end_date))
+        self.df = self.df.loc[in_range].reset_index(drop=True)
+        
+        # Derive resolution time (0 while unresolved) and the reporting periods in one assign
+        created = self.df['Created'].dt
+        self.df = self.df.assign(**{
+            'Resolution Time (days)': (self.df['Resolved'] - self.df['Created']).dt.days.fillna(0).astype('int32'),
+            'Month-Year': created.strftime('%Y-%m'),
+            'Year': created.year.astype('int16'),
+            'Month': created.month.astype('int8'),
+            'Quarter': ('Q' + created.quarter.astype(str)).astype('category'),
+        })
         
         # Fill missing values
-        self.df['Resolution Time (days)'] = self.df['Resolution Time (days)'].fillna(0)
         self.df['Resolution'] = self.df['Resolution'].fillna('Unresolved')
         self.df['Root Cause'] = self.df['Root Cause'].fillna('Unknown')
         
+        # Few distinct statuses: store as codes so status checks compare integers
+        self.df['Status'] = self.df['Status'].astype('category')
+        
         print(f"✅ Processed {len(self.df)} JIRA issues")
         return self.df
 
-    def create_analysis_dashboard(self, output_file='real_jira_analysis.xlsx'):
-        """Create comprehensive analysis dashboard"""
-        print(f"🚀 Creating analysis dashboard: {output_file}")
+    def _dashboard_cache_key(self):
+        """Key identifying the processed data and date range behind a dashboard"""
+        digest = hashlib.sha1(pd.util.hash_pandas_object(self.df, index=True).values.tobytes())
+        digest.update('|'.join(map(str, self.df.columns)).encode())
+        digest.update(f"{self.start_date}|{self.end_date}".encode())
+        return digest.hexdigest()[:16]
+
+    def create_analysis_dashboard(self, output_file='real_jira_analysis.xlsx', cache_dir=None):
+        """Create comprehensive analysis dashboard (reused from cache_dir when the data is unchanged)"""
+        cache_file = None
+        if cache_dir:
+            cache_dir = os.path.expanduser(cache_dir)
+            cache_file = os.path.join(cache_dir, f"{self._dashboard_cache_key()}.xlsx")
+            if os.path.exists(cache_file):
+                shutil.copyfile(cache_file, output_file)
+                print(f"♻️  Reused cached analysis dashboard: {cache_file}")
+                return output_file
         
-        # Create workbook
-        wb = openpyxl.Workbook()
+        print(f"🚀 Creating analysis dashboard: {output_file}")
         
-        # Remove default sheet
-        wb.remove(wb.active)
+        # Create a streaming workbook (starts without sheets; rows are written in order)
+        wb = openpyxl.Workbook(write_only=True)
         
         # Create analysis sheets
         self._create_executive_summary(wb)
@@ -154,28 +181,52 @@ class RealJiraAnalyzer:
         # Save workbook
         wb.save(output_file)
         print(f"✅ Analysis dashboard saved: {output_file}")
+        
+        if cache_file:
+            os.makedirs(cache_dir, exist_ok=True)
+            shutil.copyfile(output_file, cache_file)
         return output_file
 
+    def _styled_cells(self, ws, values, font=None, fill=None):
+        """Wrap values in write-only cells sharing one font and fill"""
+        cells = []
+        for value in values:
+            cell = WriteOnlyCell(ws, value=value)
+            if font:
+                cell.font = font
+            if fill:
+                cell.fill = fill
+            cells.append(cell)
+        return cells
+
+    def _append_title(self, ws, title, merge_range):
+        """Append the sheet title row and merge it across the given range"""
+        ws.append(self._styled_cells(ws, [title], Font(size=16, bold=True)))
+        ws.merged_cells.add(merge_range)
+
+    def _append_header(self, ws, values):
+        """Append a bold, grey-filled table header row"""
+        header_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+        ws.append(self._styled_cells(ws, values, Font(bold=True), header_fill))
+
     def _create_executive_summary(self, wb):
         """Create Executive Summary sheet"""
         ws = wb.create_sheet("📊 Executive Summary")
         
         # Title
-        ws['A1'] = "Real JIRA Data Analysis - Executive Summary"
-        ws['A1'].font = Font(size=16, bold=True)
-        ws.merge_cells('A1:F1')
+        self._append_title(ws, "Real JIRA Data Analysis - Executive Summary", 'A1:F1')
+        ws.append([])
         
         # Date range
-        ws['A3'] = f"Analysis Period: {self.start_date} to {self.end_date}"
-        ws['A3'].font = Font(size=12, bold=True)
+        ws.append(self._styled_cells(ws, [f"Analysis Period: {self.start_date} to {self.end_date}"], Font(size=12, bold=True)))
+        ws.append([])
         
         # Key metrics
         total_issues = len(self.df)
-        resolved_issues = len(self.df[self.df['Status'].isin(['Done', 'Resolved', 'Closed'])])
+        resolved_issues = int(self.df['Status'].isin(RESOLVED_STATUSES).sum())
         avg_resolution_time = self.df['Resolution Time (days)'].mean()
         
-        ws['A5'] = "Key Metrics"
-        ws['A5'].font = Font(size=14, bold=True)
+        ws.append(self._styled_cells(ws, ["Key Metrics"], Font(size=14, bold=True)))
         
         metrics = [
             ("Total Issues", total_issues),
@@ -186,59 +237,35 @@ class RealJiraAnalyzer:
             ("Analysis Date", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
         ]
         
-        for i, (metric, value) in enumerate(metrics, 6):
-            ws[f'A{i}'] = metric
-            ws[f'B{i}'] = value
-            ws[f'A{i}'].font = Font(bold=True)
+        for metric, value in metrics:
+            ws.append(self._styled_cells(ws, [metric], Font(bold=True)) + [value])
+        ws.append([])
         
         # Top integration apps
-        ws['A13'] = "Top Integration Apps by Issue Count"
-        ws['A13'].font = Font(size=14, bold=True)
+        ws.append(self._styled_cells(ws, ["Top Integration Apps by Issue Count"], Font(size=14, bold=True)))
         
         app_counts = self.df['Integration Apps'].value_counts().head(10)
-        for i, (app, count) in enumerate(app_counts.items(), 14):
-            ws[f'A{i}'] = app
-            ws[f'B{i}'] = count
+        for app, count in app_counts.items():
+            ws.append([app, count])
 
     def _create_issues_per_app_per_month(self, wb):
         """Create Issues per Integration App per Month with charts"""
         ws = wb.create_sheet("📊 Issues per App per Month")
         
         # Title
-        ws['A1'] = "Issues per Integration App per Month"
-        ws['A1'].font = Font(size=16, bold=True)
-        ws.merge_cells('A1:F1')
+        self._append_title(ws, "Issues per Integration App per Month", 'A1:F1')
+        ws.append([])
         
         # Create pivot table
-        pivot = self.df.pivot_table(
-            index='Integration Apps',
-            columns='Month-Year',
-            values='Issue Key',
-            aggfunc='count',
-            fill_value=0
-        )
-        
-        # Write pivot table
-        ws['A3'] = "Integration App"
-        col_idx = 2
-        for month in pivot.columns:
-            ws.cell(row=3, column=col_idx, value=month)
-            col_idx += 1
-        
-        # Headers styling
-        for col in range(1, col_idx):
-            ws.cell(row=3, column=col).font = Font(bold=True)
-            ws.cell(row=3, column=col).fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+        pivot = self.df.groupby(['Integration Apps', 'Month-Year']).size().unstack(fill_value=0).astype('int32')
+        
+        # Write pivot table (header on row 3)
+        self._append_header(ws, ["Integration App"] + list(pivot.columns))
         
         # Data
-        row_idx = 4
-        for app in pivot.index:
-            ws.cell(row=row_idx, column=1, value=app)
-            col_idx = 2
-            for month in pivot.columns:
-                ws.cell(row=row_idx, column=col_idx, value=pivot.loc[app, month])
-                col_idx += 1
-            row_idx += 1
+        for row in pivot.itertuples(index=True, name=None):
+            ws.append(list(row))
+        row_idx = 4 + len(pivot.index)
         
         # Add charts
         self._add_charts_to_monthly_matrix(ws, pivot, row_idx)
@@ -251,22 +278,20 @@ class RealJiraAnalyzer:
         chart1.x_axis.title = "Integration Apps"
         chart1.y_axis.title = "Number of Issues"
         
-        # Get top 10 apps
+        # Get top 10 apps (the line chart reuses the first five)
         top_apps = pivot.sum(axis=1).nlargest(10)
         
         # Data for chart
-        data_rows = []
-        for app in top_apps.index:
-            data_rows.append([app, top_apps[app]])
+        data_rows = top_apps.rename_axis('App').reset_index(name='Total Issues')
         
-        # Write chart data
+        # Write chart data (two blank rows below the table)
         chart_start_row = start_row + 2
-        ws[f'A{chart_start_row}'] = "App"
-        ws[f'B{chart_start_row}'] = "Total Issues"
+        ws.append([])
+        ws.append([])
+        ws.append(list(data_rows.columns))
         
-        for i, (app, count) in enumerate(data_rows, chart_start_row + 1):
-            ws[f'A{i}'] = app
-            ws[f'B{i}'] = count
+        for row in data_rows.itertuples(index=False, name=None):
+            ws.append(row)
         
         # Add chart
         chart1.add_data(Reference(ws, min_col=2, min_row=chart_start_row, max_row=chart_start_row + len(data_rows)))
@@ -280,24 +305,21 @@ class RealJiraAnalyzer:
         chart2.y_axis.title = "Number of Issues"
         
         # Get top 5 apps
-        top_5_apps = pivot.sum(axis=1).nlargest(5)
+        top_5_apps = top_apps.head(5)
         
-        # Write chart data
-        chart2_start_row = chart_start_row + len(data_rows) + 3
-        ws[f'A{chart2_start_row}'] = "Month"
+        # Data for chart: one row per month, one column per app
+        trend_rows = pivot.loc[top_5_apps.index].T
         
-        col_idx = 2
-        for app in top_5_apps.index:
-            ws.cell(row=chart2_start_row, column=col_idx, value=app)
-            col_idx += 1
+        # Write chart data (two blank rows below the first block)
+        chart2_start_row = chart_start_row + len(data_rows) + 3
+        ws.append([])
+        ws.append([])
+        ws.append(["Month"] + list(trend_rows.columns))
+        col_idx = 2 + len(trend_rows.columns)
         
         # Data for each month
-        for i, month in enumerate(pivot.columns, chart2_start_row + 1):
-            ws.cell(row=i, column=1, value=month)
-            col_idx = 2
-            for app in top_5_apps.index:
-                ws.cell(row=i, column=col_idx, value=pivot.loc[app, month])
-                col_idx += 1
+        for row in trend_rows.itertuples(index=True, name=None):
+            ws.append(row)
         
         # Add chart
         chart2.add_data(Reference(ws, min_col=2, min_row=chart2_start_row, max_col=col_idx-1, max_row=chart2_start_row + len(pivot.columns)))
@@ -309,40 +331,19 @@ class RealJiraAnalyzer:
         ws = wb.create_sheet("🔍 Resolution Analysis")
         
         # Title
-        ws['A1'] = "Resolution Analysis - Different Issues with Resolution Types per Month"
-        ws['A1'].font = Font(size=16, bold=True)
-        ws.merge_cells('A1:F1')
+        self._append_title(ws, "Resolution Analysis - Different Issues with Resolution Types per Month", 'A1:F1')
+        ws.append([])
         
         # Create pivot table for resolution types per month
-        resolution_pivot = self.df.pivot_table(
-            index='Resolution',
-            columns='Month-Year',
-            values='Issue Key',
-            aggfunc='count',
-            fill_value=0
-        )
-        
-        # Write pivot table
-        ws['A3'] = "Resolution Type"
-        col_idx = 2
-        for month in resolution_pivot.columns:
-            ws.cell(row=3, column=col_idx, value=month)
-            col_idx += 1
-        
-        # Headers styling
-        for col in range(1, col_idx):
-            ws.cell(row=3, column=col).font = Font(bold=True)
-            ws.cell(row=3, column=col).fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+        resolution_pivot = self.df.groupby(['Resolution', 'Month-Year']).size().unstack(fill_value=0).astype('int32')
+        
+        # Write pivot table (header on row 3)
+        self._append_header(ws, ["Resolution Type"] + list(resolution_pivot.columns))
         
         # Data
-        row_idx = 4
-        for resolution in resolution_pivot.index:
-            ws.cell(row=row_idx, column=1, value=resolution)
-            col_idx = 2
-            for month in resolution_pivot.columns:
-                ws.cell(row=row_idx, column=col_idx, value=resolution_pivot.loc[resolution, month])
-                col_idx += 1
-            row_idx += 1
+        for row in resolution_pivot.itertuples(index=True, name=None):
+            ws.append(list(row))
+        row_idx = 4 + len(resolution_pivot.index)
         
         # Add charts for resolution types
         self._add_resolution_charts(ws, resolution_pivot, row_idx)
@@ -358,14 +359,14 @@ class RealJiraAnalyzer:
         # Get resolution totals
         resolution_totals = resolution_pivot.sum(axis=1).sort_values(ascending=False)
         
-        # Write chart data
+        # Write chart data (two blank rows below the table)
         chart_start_row = start_row + 2
-        ws[f'A{chart_start_row}'] = "Resolution Type"
-        ws[f'B{chart_start_row}'] = "Total Issues"
+        ws.append([])
+        ws.append([])
+        ws.append(["Resolution Type", "Total Issues"])
         
-        for i, (resolution, count) in enumerate(resolution_totals.items(), chart_start_row + 1):
-            ws[f'A{i}'] = resolution
-            ws[f'B{i}'] = count
+        for resolution, count in resolution_totals.items():
+            ws.append([resolution, count])
         
         # Add chart
         chart1.add_data(Reference(ws, min_col=2, min_row=chart_start_row, max_row=chart_start_row + len(resolution_totals)))
@@ -377,87 +378,60 @@ class RealJiraAnalyzer:
         ws = wb.create_sheet("📈 Monthly Trends")
         
         # Title
-        ws['A1'] = "Monthly Trends Analysis"
-        ws['A1'].font = Font(size=16, bold=True)
-        ws.merge_cells('A1:D1')
+        self._append_title(ws, "Monthly Trends Analysis", 'A1:D1')
+        ws.append([])
         
         # Monthly summary
         monthly_summary = self.df.groupby('Month-Year').agg({
             'Issue Key': 'count',
             'Resolution Time (days)': 'mean',
-            'Status': lambda x: (x.isin(['Done', 'Resolved', 'Closed']).sum())
+            'Status': lambda x: (x.isin(RESOLVED_STATUSES).sum())
         }).round(2)
         
         monthly_summary.columns = ['Total Issues', 'Avg Resolution Time (days)', 'Resolved Issues']
         monthly_summary['Resolution Rate'] = (monthly_summary['Resolved Issues'] / monthly_summary['Total Issues'] * 100).round(1)
         
         # Write data
-        ws['A3'] = "Month-Year"
-        ws['B3'] = "Total Issues"
-        ws['C3'] = "Resolved Issues"
-        ws['D3'] = "Resolution Rate (%)"
-        ws['E3'] = "Avg Resolution Time (days)"
-        
-        # Headers styling
-        for col in ['A3', 'B3', 'C3', 'D3', 'E3']:
-            ws[col].font = Font(bold=True)
-            ws[col].fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+        self._append_header(ws, ["Month-Year", "Total Issues", "Resolved Issues", "Resolution Rate (%)", "Avg Resolution Time (days)"])
         
         # Data
-        for i, (month, row) in enumerate(monthly_summary.iterrows(), 4):
-            ws[f'A{i}'] = month
-            ws[f'B{i}'] = row['Total Issues']
-            ws[f'C{i}'] = row['Resolved Issues']
-            ws[f'D{i}'] = row['Resolution Rate']
-            ws[f'E{i}'] = row['Avg Resolution Time (days)']
+        columns = ['Total Issues', 'Resolved Issues', 'Resolution Rate', 'Avg Resolution Time (days)']
+        for row in monthly_summary[columns].itertuples(index=True, name=None):
+            ws.append(row)
 
     def _create_integration_apps_analysis(self, wb):
         """Create Integration Apps Analysis sheet"""
         ws = wb.create_sheet("🔧 Integration Apps")
         
         # Title
-        ws['A1'] = "Integration Apps Analysis"
-        ws['A1'].font = Font(size=16, bold=True)
-        ws.merge_cells('A1:E1')
+        self._append_title(ws, "Integration Apps Analysis", 'A1:E1')
+        ws.append([])
         
         # App summary
         app_summary = self.df.groupby('Integration Apps').agg({
             'Issue Key': 'count',
             'Resolution Time (days)': 'mean',
-            'Status': lambda x: (x.isin(['Done', 'Resolved', 'Closed']).sum())
+            'Status': lambda x: (x.isin(RESOLVED_STATUSES).sum())
         }).round(2)
         
         app_summary.columns = ['Total Issues', 'Avg Resolution Time (days)', 'Resolved Issues']
         app_summary['Resolution Rate'] = (app_summary['Resolved Issues'] / app_summary['Total Issues'] * 100).round(1)
         
         # Write data
-        ws['A3'] = "Integration App"
-        ws['B3'] = "Total Issues"
-        ws['C3'] = "Resolved Issues"
-        ws['D3'] = "Resolution Rate (%)"
-        ws['E3'] = "Avg Resolution Time (days)"
-        
-        # Headers styling
-        for col in ['A3', 'B3', 'C3', 'D3', 'E3']:
-            ws[col].font = Font(bold=True)
-            ws[col].fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+        self._append_header(ws, ["Integration App", "Total Issues", "Resolved Issues", "Resolution Rate (%)", "Avg Resolution Time (days)"])
         
         # Data
-        for i, (app, row) in enumerate(app_summary.iterrows(), 4):
-            ws[f'A{i}'] = app
-            ws[f'B{i}'] = row['Total Issues']
-            ws[f'C{i}'] = row['Resolved Issues']
-            ws[f'D{i}'] = row['Resolution Rate']
-            ws[f'E{i}'] = row['Avg Resolution Time (days)']
+        columns = ['Total Issues', 'Resolved Issues', 'Resolution Rate', 'Avg Resolution Time (days)']
+        for row in app_summary[columns].itertuples(index=True, name=None):
+            ws.append(row)
 
     def _create_root_cause_analysis(self, wb):
         """Create Root Cause Analysis sheet"""
         ws = wb.create_sheet("🔍 Root Cause Analysis")
         
         # Title
-        ws['A1'] = "Root Cause Analysis"
-        ws['A1'].font = Font(size=16, bold=True)
-        ws.merge_cells('A1:E1')
+        self._append_title(ws, "Root Cause Analysis", 'A1:E1')
+        ws.append([])
         
         # Root cause summary
         root_cause_summary = self.df.groupby('Root Cause').agg({
@@ -469,38 +443,23 @@ class RealJiraAnalyzer:
         root_cause_summary = root_cause_summary.sort_values('Count', ascending=False)
         
         # Write data
-        ws['A3'] = "Root Cause"
-        ws['B3'] = "Count"
-        ws['C3'] = "Avg Resolution Time (days)"
-        
-        # Headers styling
-        for col in ['A3', 'B3', 'C3']:
-            ws[col].font = Font(bold=True)
-            ws[col].fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+        self._append_header(ws, ["Root Cause", "Count", "Avg Resolution Time (days)"])
         
         # Data
-        for i, (cause, row) in enumerate(root_cause_summary.iterrows(), 4):
-            ws[f'A{i}'] = cause
-            ws[f'B{i}'] = row['Count']
-            ws[f'C{i}'] = row['Avg Resolution Time (days)']
+        for row in root_cause_summary.itertuples(index=True, name=None):
+            ws.append(row)
 
     def _create_raw_data(self, wb):
         """Create Raw Data sheet"""
         ws = wb.create_sheet("📄 Raw Data")
         
         # Title
-        ws['A1'] = "Raw JIRA Data"
-        ws['A1'].font = Font(size=16, bold=True)
-        ws.merge_cells('A1:M1')
-        
-        # Write DataFrame to sheet
-        for r in dataframe_to_rows(self.df, index=False, header=True):
-            ws.append(r)
-        
-        # Style headers
-        for col in range(1, len(self.df.columns) + 1):
-            ws.cell(row=2, column=col).font = Font(bold=True)
-            ws.cell(row=2, column=col).fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+        self._append_title(ws, "Raw JIRA Data", 'A1:M1')
+        
+        # Write DataFrame to sheet (styled header first, then one plain tuple per issue)
+        self._append_header(ws, list(self.df.columns))
+        for row in self.df.itertuples(index=False, name=None):
+            ws.append(row)
 
 def main():
     parser = argparse.ArgumentParser(description="Pull real JIRA data and create comprehensive analysis")
@@ -508,6 +467,7 @@ def main():
     parser.add_argument('--end-date', type=str, required=True, help='End date (YYYY-MM-DD)')
     parser.add_argument('--project-key', type=str, default='CS', help='JIRA Project Key')
     parser.add_argument('--output', type=str, default='real_jira_analysis.xlsx', help='Output file name')
+    parser.add_argument('--cache-dir', type=str, default=None, help='Reuse dashboards built from identical data (e.g. ~/.cache/jira_dashboard)')
     args = parser.parse_args()
     
     print("📊 Real JIRA Data Analyzer")
@@ -530,7 +490,7 @@ def main():
         df = analyzer.process_data(real_data)
         
         # Create analysis dashboard
-        output_file = analyzer.create_analysis_dashboard(args.output)
+        output_file = analyzer.create_analysis_dashboard(args.output, cache_dir=args.cache_dir)
         
         print(f"\n🎉 SUCCESS! Real JIRA Analysis Complete:")
         print(f"   📁 File: {output_file}")
@@ -545,7 +505,7 @@ def main():
         # Show summary statistics
         print(f"\n📈 Summary Statistics:")
         print(f"   Total Issues: {len(df)}")
-        print(f"   Resolved Issues: {len(df[df['Status'].isin(['Done', 'Resolved', 'Closed'])])}")
+        print(f"   Resolved Issues: {df['Status'].isin(RESOLVED_STATUSES).sum()}")
         print(f"   Avg Resolution Time: {df['Resolution Time (days)'].mean():.1f} days")
         print(f"   Top Integration App: {df['Integration Apps'].value_counts().index[0]} ({df['Integration Apps'].value_counts().iloc[0]} issues)")
         